@@ -1,4 +1,6 @@
 import argparse
+import fnmatch
+import os
 import time
 
 from abc import ABC, abstractmethod
@@ -66,6 +68,13 @@ class FileOperation(ABC):
         """
         Scans the source directory for files that match the given patterns.
 
+        The directory is read once with os.scandir and every entry name is checked
+        against all patterns with fnmatch, instead of globbing the directory once per
+        pattern. Each pattern is wrapped as '*<pattern>*', so wildcards and the
+        platform's case rule behave as they did with glob.
+        The source directory is resolved once, and only symlinked entries are resolved
+        on their own. A link and its target therefore give one path, the target's.
+
         Args:
             source_directory (Path): The folder to search in.
             pattern (Union[Tuple[str], Tuple[str, ...]]): A tuple of strings
@@ -74,13 +83,18 @@ class FileOperation(ABC):
         Returns:
             Tuple[Path]: A tuple containing Path objects of the found files.
         """
-        files = set()
-
-        for p in pattern:
-            current_pattern_files = source_directory.glob(f"*{p}*")
-            files.update(current_pattern_files)
+        base = source_directory.resolve()
+        # the f-string keeps the old glob semantics for non-string defaults, e.g. the empty tuple from settings
+        patterns = tuple(f"*{p}*" for p in pattern)
+
+        with os.scandir(base) as entries:
+            # dict.fromkeys drops a target that is also reached through a link, keeping the scan order
+            files_for_task = tuple(dict.fromkeys(
+                Path(os.path.realpath(entry.path)) if entry.is_symlink() else base / entry.name
+                for entry in entries
+                if any(fnmatch.fnmatch(entry.name, p) for p in patterns)
+            ))
 
-        files_for_task = tuple(file.resolve() for file in files)
         self.logger.debug(f"Total files_for_task: {len(files_for_task)}")
         return files_for_task
 
@@ -5,6 +5,7 @@ from typing import Union, Dict, Tuple
 from const_utils.arguments import Arguments
 from const_utils.default_values import AppSettings
 from const_utils.parser_help import HelpStrings
+from const_utils.stats_constansts import ImageStatsKeys
 from file_operations.file_operation import FileOperation
 from services.directory_utils import generate_directory_name
 from tools.stats.base_stats import BaseStats
@@ -113,6 +114,8 @@ class StatsOperation(FileOperation):
             return
 
         self.logger.info(f"Found {len(self.files_for_task)} annotations in {self.src}")
+        # sorted categories give the reports their class order, and groupby runs on integer codes
+        df[ImageStatsKeys.class_name] = df[ImageStatsKeys.class_name].astype("category")
 
         self.reporter.show_console_report(df=df, target_format=self.target_format)
 
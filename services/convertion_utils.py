@@ -2,6 +2,7 @@ from pathlib import Path
 from typing import Iterable
 
 import cv2
+import numpy as np
 
 
 def to_voc_dict(annotations: Iterable, correspond_img: str, class_mapping: dict) -> dict:
@@ -10,7 +11,9 @@ def to_voc_dict(annotations: Iterable, correspond_img: str, class_mapping: dict)
 
     This function reads the associated image to determine its dimensions.
     It then transforms normalized coordinates (range 0.0 to 1.0) into
-    absolute pixel coordinates (xmin, ymin, xmax, ymax).
+    absolute pixel coordinates (xmin, ymin, xmax, ymax). All lines are tokenized
+    at once with np.loadtxt and the bbox math runs on whole columns. Class IDs
+    are kept as strings, so they are looked up in class_mapping verbatim.
 
     Args:
         annotations (Iterable[str]): A collection of YOLO strings,
@@ -20,8 +23,14 @@ def to_voc_dict(annotations: Iterable, correspond_img: str, class_mapping: dict)
 
     Returns:
         Dict[str, Any]: A dictionary following the VOC XML schema.
-            Returns an empty dictionary if the image cannot be loaded.
+            Returns an empty dictionary if there are no annotations or the image
+            cannot be loaded.
     """
+    lines = list(annotations)
+
+    if not lines:
+        return {}
+
     image = cv2.imread(correspond_img)
 
     if image is None:
@@ -34,36 +43,34 @@ def to_voc_dict(annotations: Iterable, correspond_img: str, class_mapping: dict)
     im_name = correspond_img.name
 
     objects = []
+    rows = np.loadtxt(lines, dtype=str, ndmin=2)
 
-    for annotation in annotations:
-        class_id, *coords = annotation.split(" ")
-        class_name = class_mapping.get(class_id, f"object_{class_id}")
-        obj_xcenter, obj_ycenter, obj_width, obj_height = map(float, coords)
+    if rows.size:
+        class_ids = rows[:, 0]
+        obj_xcenter, obj_ycenter, obj_width, obj_height = rows[:, 1:5].astype(np.float64).T
         # ----- bbox transformation -----
-        xmin = round(((obj_xcenter - obj_width / 2) * img_width))
-        ymin = round((obj_ycenter - obj_height / 2) * img_height)
-        xmax = round((obj_xcenter + obj_width / 2) * img_width)
-        ymax = round((obj_ycenter + obj_height / 2) * img_height)
-        voc_object = {
-            "name": class_name,
-            "pose": "Unspecified",
-            "truncated": int(
-                any([
-                    xmin <= 0,
-                    ymin <= 0,
-                    xmax >= img_width,
-                    ymax >= img_height,
-                ])
-            ),
-            "difficult": 0,
-            "bndbox": {
-                "xmin": xmin,
-                "ymin": ymin,
-                "xmax": xmax,
-                "ymax": ymax
+        xmin = np.rint((obj_xcenter - obj_width / 2) * img_width).astype(np.int64)
+        ymin = np.rint((obj_ycenter - obj_height / 2) * img_height).astype(np.int64)
+        xmax = np.rint((obj_xcenter + obj_width / 2) * img_width).astype(np.int64)
+        ymax = np.rint((obj_ycenter + obj_height / 2) * img_height).astype(np.int64)
+        truncated = (xmin <= 0) | (ymin <= 0) | (xmax >= img_width) | (ymax >= img_height)
+
+        for class_id, x_min, y_min, x_max, y_max, is_truncated in zip(
+                class_ids.tolist(), xmin.tolist(), ymin.tolist(), xmax.tolist(), ymax.tolist(), truncated.tolist()
+        ):
+            voc_object = {
+                "name": class_mapping.get(class_id, f"object_{class_id}"),
+                "pose": "Unspecified",
+                "truncated": int(is_truncated),
+                "difficult": 0,
+                "bndbox": {
+                    "xmin": x_min,
+                    "ymin": y_min,
+                    "xmax": x_max,
+                    "ymax": y_max
+                }
             }
-        }
-        objects.append(voc_object)
+            objects.append(voc_object)
 
     converted_dict = {
         "annotation": {
@@ -37,25 +37,29 @@ class OutlierDetector:
             return df
 
         df = df.copy()
-        
-        for col in columns:
+        columns = [col for col in columns if col in df.columns]
+        is_outlier = np.zeros((len(df), 1), dtype="int8")
 
-            if col not in df.columns:
-                continue
+        if columns:
+            # quartiles of all columns per class come from a single groupby
+            quantiles = df.groupby(ImageStatsKeys.class_name)[columns].quantile([0.25, 0.75])
+            q1 = quantiles.xs(0.25, level=-1)
+            q3 = quantiles.xs(0.75, level=-1)
+            iqr = q3 - q1
+            upper_limits = q3 + 1.5 * iqr
+            lower_limits = (q1 - 1.5 * iqr).clip(lower=0)
 
-            outlier_column_name = f"{outlier_marker}{col}"
+            # limits are aligned to the rows once and compared for all columns at once
+            classes = df[ImageStatsKeys.class_name]
+            values = df[columns].to_numpy(dtype=np.float64)
+            is_outlier = (
+                (values < lower_limits.reindex(classes).to_numpy()) |
+                (values > upper_limits.reindex(classes).to_numpy())
+            ).astype("int8")
 
-            class_group = df.groupby(ImageStatsKeys.class_name)[col]
-            stats: pd.DataFrame = class_group.quantile([0.25, 0.75]).unstack()
-            stats.columns = ["q1", "q3"]
-            stats["iqr"] = stats["q3"] - stats["q1"]
-            stats["upper_limit"] = stats["q3"] + 1.5 * stats["iqr"]
-            stats["lower_limit"] = np.clip(stats["q1"] - 1.5 * stats["iqr"], a_min=0, a_max=None)
+            for idx, col in enumerate(columns):
+                df[f"{outlier_marker}{col}"] = is_outlier[:, idx]
 
-            upper_bounds = df[ImageStatsKeys.class_name].map(stats["upper_limit"])
-            lower_bounds = df[ImageStatsKeys.class_name].map(stats["lower_limit"])
-            df[outlier_column_name] = ((df[col] < lower_bounds) | (df[col] > upper_bounds)).astype("int8")
-
-        outlier_cols = [col for col in df.columns if col. startswith(outlier_marker)]
-        df["outlier_any"] = df[outlier_cols].any(axis=1).astype("int8")
+        # flags of this call are OR-ed row-wise, flags left over from earlier calls never leak in
+        df[ImageStatsKeys.outlier_any] = np.bitwise_or.reduce(is_outlier, axis=1)
         return df
\ No newline at end of file
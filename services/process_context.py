@@ -0,0 +1,28 @@
+import multiprocessing
+from multiprocessing.context import BaseContext
+from typing import Optional
+
+
+WORKER_PRELOAD = ["cv2", "numpy"]
+
+
+def worker_mp_context() -> Optional[BaseContext]:
+    """
+    Returns the multiprocessing context used for all worker process pools.
+
+    The parent has often already read a parquet cache, so pyarrow threads are
+    running in it, and fork() of a multi-threaded process can deadlock the
+    children. Where it is available, the forkserver start method is used
+    instead: the server process preloads cv2 and numpy once and every worker
+    is forked from that single-threaded server.
+
+    Returns:
+        Optional[BaseContext]: The forkserver context, or None to keep the
+            platform default (spawn on Windows).
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return None
+
+    context = multiprocessing.get_context("forkserver")
+    context.set_forkserver_preload(WORKER_PRELOAD)
+    return context
@@ -1,9 +1,9 @@
 import pytest
 import numpy as np
-import pandas as pd
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 from tools.comparer.img_comparer.hasher.dhash import DHash
+from tools.comparer.img_comparer.hasher.base_hasher import _popcount
 
 
 @pytest.fixture
@@ -17,21 +17,6 @@ def hasher(settings, mock_cache_io):
     return DHash(settings=settings, cache_io=mock_cache_io)
 
 
-def test_df_to_hash_map_conversion(hasher):
-    """Test convertion from Pandas back to Dict[Path, np.array]."""
-    test_df = pd.DataFrame([
-        {'path': '/tmp/1.jpg', 'hash': [True, False]},
-        {'path': '/tmp/2.jpg', 'hash': [False, True]}
-    ])
-
-    result = hasher._df_to_hash_map(test_df)
-
-    assert len(result) == 2
-    assert isinstance(list(result.keys())[0], Path)
-    assert isinstance(list(result.values())[0], np.ndarray)
-    assert result[Path('/tmp/1.jpg')][0] == True
-
-
 def test_validate_hash_map_sync(hasher):
     """Synchronization test: removing old files and detecting new ones."""
     # Дані в кеші (один файл видалено з диска)
@@ -51,12 +36,35 @@ def test_validate_hash_map_sync(hasher):
         assert Path("new.jpg") in final_map
 
 
+def test_validate_hash_map_rehashes_changed_files(hasher):
+    """Files whose mtime or size changed since hashing are hashed again."""
+    hash_map = {Path("same.jpg"): np.array([1], dtype=np.uint8), Path("edited.jpg"): np.array([2], dtype=np.uint8)}
+    cached_stats = {Path("same.jpg"): (10, 100), Path("edited.jpg"): (10, 100)}
+    file_stats = {Path("same.jpg"): (10, 100), Path("edited.jpg"): (20, 100)}
+
+    with patch.object(hasher, 'update_hashes', return_value=[np.array([3], dtype=np.uint8)]) as mock_update:
+        is_valid, final_map = hasher.validate_hash_map(tuple(hash_map), hash_map, file_stats, cached_stats)
+
+    assert is_valid is False
+    mock_update.assert_called_once_with((Path("edited.jpg"),))
+    assert final_map[Path("edited.jpg")].tolist() == [3]
+    assert final_map[Path("same.jpg")].tolist() == [1]
+
+
+def test_file_stats_reads_mtime_and_size(tmp_path):
+    """File stats are collected per directory and skip files that do not exist."""
+    image = tmp_path / "a.jpg"
+    image.write_bytes(b"12345")
+
+    stats = DHash._file_stats((image, tmp_path / "missing.jpg"))
+
+    assert stats == {image: (image.stat().st_mtime_ns, 5)}
+
+
 def test_get_hashmap_cache_hit(hasher, mock_cache_io):
     """Test that when cache is valid, no new hash calculations are performed."""
     path = Path("test.jpg")
-    test_df = pd.DataFrame([{'path': str(path), 'hash': [True]}])
-
-    mock_cache_io.load.return_value = test_df
+    mock_cache_io.load_hashmap.return_value = ({path: np.packbits([True])}, {})
 
     with patch.object(hasher, 'update_hashes') as mock_update:
         result = hasher.get_hashmap((path,))
@@ -88,7 +96,8 @@ def test_find_duplicates_vectorization(hasher):
 def test_n_jobs_clamping(hasher):
     """Test that n_jobs is clamped to a valid range based on CPU cores."""
     import multiprocessing
-    cores = multiprocessing.cpu_count()
+    import os
+    cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else multiprocessing.cpu_count()
 
     hasher.n_jobs = 999
     assert hasher.n_jobs == cores - 1 if cores > 1 else 1
@@ -104,4 +113,81 @@ def test_threshold_recalculation_on_core_size_change(hasher):
     assert hasher.threshold == 6
 
     hasher.core_size = 16  # 256 bits -> threshold 25
-    assert hasher.threshold == 25
\ No newline at end of file
+    assert hasher.threshold == 25
+
+def test_find_duplicates_blocking_is_transparent(hasher):
+    """Splitting the comparison into tiles gives the same duplicates as one big tile."""
+    rng = np.random.default_rng(0)
+    base = rng.integers(0, 2, size=(20, 64)).astype(bool)
+    hashes = np.concatenate([base, base[:5] ^ (rng.random((5, 64)) < 0.03)])
+    hash_map = {Path(f"{i}.jpg"): h for i, h in enumerate(hashes)}
+    hasher._threshold = 3
+    hasher.MIN_BAND_BITS = 1 << 10  # always compare all pairs
+
+    expected = hasher.find_duplicates(hash_map)
+    hasher.COMPARE_TILE_BYTES = 1
+    blocked = hasher.find_duplicates(hash_map)
+
+    assert blocked == expected
+    assert len(expected) >= 1
+
+
+@pytest.mark.parametrize("threshold", [0, 3, 6])
+def test_banded_search_matches_full_scan(hasher, threshold):
+    """Band bucketing finds exactly the duplicates of the all-pairs scan, in the same greedy order."""
+    rng = np.random.default_rng(1)
+    base = rng.integers(0, 2, size=(30, 64)).astype(bool)
+    hashes = np.concatenate([base, base ^ (rng.random((30, 64)) < 0.05), base[:10]])
+    hasher._threshold = threshold
+    packed = hasher._pack_words(hashes)
+
+    banded = hasher._banded_duplicates(hashes, packed)
+
+    assert banded is not None
+    assert np.array_equal(banded, hasher._tiled_duplicates(packed))
+
+
+def test_banded_search_falls_back_for_crowded_buckets(hasher):
+    """Identical hashes land in one bucket, so the full scan is used and still finds them."""
+    hashes = np.zeros((10, 64), dtype=bool)
+    hash_map = {Path(f"{i}.jpg"): h for i, h in enumerate(hashes)}
+    hasher._threshold = 3
+
+    assert hasher._banded_duplicates(hashes, hasher._pack_words(hashes)) is None
+    assert hasher.find_duplicates(hash_map) == [Path(f"{i}.jpg") for i in range(1, 10)]
+
+
+def test_pack_words_keeps_hamming_distance(hasher):
+    """Packing into uint64 words preserves bit differences, including non multiple of 64 lengths."""
+    a = np.zeros(70, dtype=bool)
+    b = a.copy()
+    b[[0, 33, 69]] = True
+
+    words = hasher._pack_words(np.stack([a, b]))
+
+    assert words.dtype == np.uint64
+    assert words.shape == (2, 2)
+    assert sum(bin(int(x)).count("1") for x in words[0] ^ words[1]) == 3
+
+
+def test_popcount_matches_bit_count():
+    """The word-parallel popcount agrees with a plain bit count on random and edge words."""
+    rng = np.random.default_rng(0)
+    words = np.concatenate([
+        rng.integers(0, np.iinfo(np.uint64).max, size=64, dtype=np.uint64, endpoint=True),
+        np.array([0, np.iinfo(np.uint64).max], dtype=np.uint64)
+    ])
+
+    assert _popcount(words).tolist() == [bin(int(x)).count("1") for x in words]
+
+
+def test_find_duplicates_accepts_packed_hashes(hasher):
+    """Packed uint8 hashes give the same duplicates as their boolean form."""
+    h1 = np.zeros(64, dtype=bool)
+    h2 = h1.copy(); h2[:2] = True
+    h3 = ~h1
+    bool_map = {Path("1.jpg"): h1, Path("2.jpg"): h2, Path("3.jpg"): h3}
+    packed_map = {path: np.packbits(h) for path, h in bool_map.items()}
+    hasher._threshold = 3
+
+    assert hasher.find_duplicates(packed_map) == hasher.find_duplicates(bool_map) == [Path("2.jpg")]
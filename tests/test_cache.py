@@ -1,6 +1,7 @@
 import pytest
 import pandas as pd
 import numpy as np
+import pyarrow.parquet as pq
 from pathlib import Path
 from tools.cache import CacheIO
 
@@ -79,4 +80,99 @@ def test_load_non_existent_file(cache_io, tmp_path):
 def test_save_invalid_type(cache_io, tmp_path):
     """Checks if passing invalid data types raises a TypeError."""
     with pytest.raises(TypeError):
-        cache_io.save(["not", "a", "dict"], tmp_path / "fail.parquet")
\ No newline at end of file
+        cache_io.save(["not", "a", "dict"], tmp_path / "fail.parquet")
+
+def test_saved_hashes_are_bit_packed(cache_io, tmp_path):
+    """Boolean hashes are stored as packed bytes."""
+    cache_file = tmp_path / "packed.parquet"
+    hash_data = np.zeros(64, dtype=bool)
+    hash_data[[0, 9, 63]] = True
+
+    cache_io.save({Path("/tmp/img.jpg"): hash_data}, cache_file)
+    df = cache_io.load(cache_file)
+
+    assert df.iloc[0]["hash"] == np.packbits(hash_data).tobytes()
+
+
+def test_generate_cache_filename_relative_and_absolute_match(cache_io, tmp_path, monkeypatch):
+    """A relative and an absolute path to the same folder give the same cache name."""
+    folder = tmp_path / "imgs"
+    folder.mkdir()
+    monkeypatch.chdir(tmp_path)
+
+    assert cache_io.generate_cache_filename(Path("imgs"), None) == cache_io.generate_cache_filename(folder, None)
+
+
+def test_save_hash_map_in_several_row_groups(cache_io, tmp_path, monkeypatch):
+    """Hash maps larger than one row group are streamed and read back completely."""
+    monkeypatch.setattr(CacheIO, "ROW_GROUP_SIZE", 2)
+    cache_file = tmp_path / "groups.parquet"
+    test_data = {Path(f"/tmp/{i}.jpg"): np.array([i % 2, 1, 0], dtype=bool) for i in range(5)}
+
+    cache_io.save(test_data, cache_file)
+    df = cache_io.load(cache_file)
+
+    assert df["path"].tolist() == [str(p) for p in test_data]
+    assert pq.ParquetFile(cache_file).num_row_groups == 3
+
+
+def test_save_packed_hashes_as_is(cache_io, tmp_path):
+    """Already packed uint8 hashes are stored without repacking."""
+    cache_file = tmp_path / "packed_input.parquet"
+    packed = np.array([1, 2, 255], dtype=np.uint8)
+
+    cache_io.save({Path("/tmp/img.jpg"): packed}, cache_file)
+    df = cache_io.load(cache_file)
+
+    assert df.iloc[0]["hash"] == packed.tobytes()
+
+
+def test_load_hashmap_returns_packed_matrix_rows(cache_io, tmp_path):
+    """load_hashmap restores paths and packed hashes without going through pandas."""
+    cache_file = tmp_path / "packed.parquet"
+    hashes = np.array([[1, 2, 3], [4, 5, 6]], dtype=np.uint8)
+    cache_io.save_hashmap({Path("/tmp/a.jpg"): hashes[0], Path("/tmp/b.jpg"): hashes[1]}, cache_file)
+
+    hash_map, file_stats = cache_io.load_hashmap(cache_file)
+
+    assert list(hash_map) == [Path("/tmp/a.jpg"), Path("/tmp/b.jpg")]
+    assert np.array_equal(np.stack(list(hash_map.values())), hashes)
+    assert file_stats == {}
+    assert cache_io.load_hashmap(tmp_path / "missing.parquet") == ({}, {})
+
+
+def test_save_and_load_hashmap_file_stats(cache_io, tmp_path):
+    """File stats are stored next to the hashes, unknown files get (-1, -1)."""
+    cache_file = tmp_path / "stats.parquet"
+    hash_map = {Path("/tmp/a.jpg"): np.array([1], dtype=np.uint8), Path("/tmp/b.jpg"): np.array([2], dtype=np.uint8)}
+
+    cache_io.save_hashmap(hash_map, cache_file, {Path("/tmp/a.jpg"): (123, 45)})
+    _, file_stats = cache_io.load_hashmap(cache_file)
+
+    assert file_stats == {Path("/tmp/a.jpg"): (123, 45), Path("/tmp/b.jpg"): (-1, -1)}
+
+
+def test_load_selected_columns_and_rows(cache_io, tmp_path):
+    """Column selection and row filters are applied while reading the parquet file."""
+    cache_file = tmp_path / "stats.parquet"
+    cache_io.save_dataframe(
+        pd.DataFrame({"path": ["a", "b", "c"], "mtime": [1.0, 2.0, 3.0], "umap_x": [0.1, 0.2, 0.3]}), cache_file
+    )
+
+    df = cache_io.load(cache_file, columns=["path", "mtime"], filters=[("path", "in", ["a", "c"])])
+
+    assert list(df.columns) == ["path", "mtime"]
+    assert df["path"].tolist() == ["a", "c"]
+
+
+def test_save_and_load_model(cache_io, tmp_path):
+    """A stored model round-trips, a missing or corrupted model file gives None"""
+    model_file = tmp_path / "stats.joblib"
+    assert cache_io.load_model(model_file) is None
+
+    cache_io.save_model({"columns": ["a", "b"]}, model_file)
+    assert cache_io.load_model(model_file) == {"columns": ["a", "b"]}
+
+    model_file.write_bytes(b"not a model")
+    assert cache_io.load_model(model_file) is None
+    assert not model_file.exists()
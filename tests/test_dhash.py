@@ -88,11 +88,14 @@ def test_core_size(hasher, input_value, expected_val):
     assert hasher.core_size == expected_val
 
 
+CORES = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else multiprocessing.cpu_count()
+
+
 @pytest.mark.parametrize("input_value, expected_value", [
-    (100, multiprocessing.cpu_count() - 1 if multiprocessing.cpu_count() > 1 else 1),
+    (100, CORES - 1 if CORES > 1 else 1),
     (0, 1),
     (-5, 1),
-    ("4", 4 if multiprocessing.cpu_count() > 4 else multiprocessing.cpu_count() - 1),
+    ("4", 4 if CORES > 4 else max(CORES - 1, 1)),
 ])
 def test_n_jobs_clamping(hasher, input_value, expected_value):
     hasher.n_jobs = input_value
@@ -118,9 +121,10 @@ def test_compute_hash_returns_correct_shape(hasher, create_test_image, input_val
     # Assert
     assert result is not None
     assert isinstance(result, np.ndarray)
-    # the shape must be core_size * core_size (16*16=256)
-    assert result.shape == (expected_val,)
-    assert result.dtype == bool
+    # core_size * core_size bits (16*16=256) are packed into bytes (256 / 8 = 32)
+    assert result.shape == ((expected_val + 7) // 8,)
+    assert result.dtype == np.uint8
+    assert result.shape == (hasher.hash_bytes,)
 
 def test_compute_hash_with_invalid_file(hasher, tmp_path):
     # Arrange
@@ -143,6 +147,43 @@ def test_compute_hash_consistency(hasher, create_test_image):
     assert np.array_equal(hash1, hash2)
 
 
+@pytest.mark.parametrize("width, height", [(100, 100), (300, 200), (1000, 800)])
+def test_compute_hash_matches_full_decode(hasher, create_test_image, width, height):
+    """Small images fall back to a full decode, larger ones are decoded reduced with the same hash."""
+    img_path = create_test_image("gradient.jpg", width=width, height=height)
+
+    image = cv2.imread(str(img_path), cv2.IMREAD_GRAYSCALE)
+    resized = cv2.resize(image, (hasher.core_size + 1, hasher.core_size), interpolation=cv2.INTER_AREA)
+    expected = np.packbits(resized[:, 1:] > resized[:, :-1])
+
+    assert np.array_equal(hasher.compute_hash(img_path, hasher.core_size), expected)
+
+
+@pytest.mark.parametrize("filename", ["small.png", "large.png", "image.bmp"])
+def test_compute_hash_decodes_non_jpeg_once(hasher, create_test_image, filename):
+    """Formats without DCT scaling are read once at full size, without a reduced probe"""
+    img_path = create_test_image(filename, width=1000 if filename.startswith("large") else 100)
+
+    with patch("tools.comparer.img_comparer.hasher.dhash.cv2.imread", wraps=cv2.imread) as mock_imread:
+        result = hasher.compute_hash(img_path, hasher.core_size)
+
+    mock_imread.assert_called_once_with(str(img_path), cv2.IMREAD_GRAYSCALE)
+    assert result is not None
+
+def test_compute_hash_skips_resize_for_hash_sized_image(hasher, tmp_path):
+    """An image that already has the hash size is compared pixel by pixel without resizing"""
+    rng = np.random.default_rng(0)
+    image = rng.integers(0, 256, (hasher.core_size, hasher.core_size + 1), dtype=np.uint8)
+    img_path = tmp_path / "thumb.png"
+    cv2.imwrite(str(img_path), image)
+
+    with patch("tools.comparer.img_comparer.hasher.dhash.cv2.resize") as mock_resize:
+        result = hasher.compute_hash(img_path, hasher.core_size)
+
+    mock_resize.assert_not_called()
+    assert np.array_equal(result, np.packbits(image[:, 1:] > image[:, :-1]))
+
+
 def test_threshold_conversion(hasher):
     """Перевірка, що відсоток правильно конвертувався в біти"""
     hasher.core_size = 8
@@ -247,4 +288,15 @@ def test_different_images_with_similar_composition(hasher, input_value, expected
         assert bool(result) == expected_value
     finally:
         if os.path.exists(path_img1): os.remove(path_img1)
-        if os.path.exists(path_img2): os.remove(path_img2)
\ No newline at end of file
+        if os.path.exists(path_img2): os.remove(path_img2)
+
+def test_update_hashes_through_shared_memory(hasher, create_test_image, tmp_path):
+    """Hashes computed by workers match direct computation, unreadable files give None"""
+    image_path = create_test_image("shared.png")
+    broken_path = tmp_path / "broken.jpg"
+    broken_path.write_text("not an image")
+
+    hashes = hasher.update_hashes((image_path, broken_path))
+
+    assert np.array_equal(hashes[0], hasher.compute_hash(image_path, hasher.core_size))
+    assert hashes[1] is None
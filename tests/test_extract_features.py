@@ -67,4 +67,15 @@ def test_multiple_objects_flag(base_data):
     results = FeatureExtractor.extract_features("test.xml", base_data)
     assert len(results) == 2
     assert results[0]["has_neighbors"] == 1
-    assert results[1]["class_name"] == "dog"
\ No newline at end of file
+    assert results[1]["class_name"] == "dog"
+
+def test_full_size_requires_all_four_truncations(base_data):
+    """full_size is set only for an object touching every image border"""
+    base_data["object"] = [
+        {"name": "car", "bndbox": {"xmin": 0, "ymin": 0, "xmax": 100, "ymax": 100}},
+        {"name": "car", "bndbox": {"xmin": 0, "ymin": 0, "xmax": 100, "ymax": 50}},
+    ]
+    results = FeatureExtractor.extract_features("test.xml", base_data)
+
+    assert [res["full_size"] for res in results] == [1, 0]
+    assert results[1]["truncated_bottom"] == 0
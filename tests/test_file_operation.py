@@ -61,3 +61,53 @@ def test_move_files(tmp_path, settings):
     assert (dst / "video1.mp4").exists()
     assert (dst / "video2.avi").exists()
     assert not (dst / "image1.jpg").exists()
+
+def test_get_files_matches_each_file_once(tmp_path, settings):
+    src = tmp_path / "source"
+    src.mkdir()
+    (src / "clip.mp4.avi").write_text("fake_data")
+    (src / "notes.txt").write_text("fake_data")
+
+    operation = MoveOperation(settings=settings, src=str(src), dst=str(tmp_path), pattern=(".mp4", ".avi"))
+    files_for_task = operation.get_files(source_directory=operation.source_directory, pattern=operation.pattern)
+
+    assert files_for_task == ((src / "clip.mp4.avi").resolve(), )
+
+def test_get_files_with_default_pattern(tmp_path, settings):
+    src = tmp_path / "source"
+    src.mkdir()
+    (src / "image.jpg").write_text("fake_data")
+
+    operation = MoveOperation(settings=settings, src=str(src), dst=str(tmp_path), pattern=[settings.pattern])
+    files_for_task = operation.get_files(source_directory=operation.source_directory, pattern=operation.pattern)
+
+    assert files_for_task == ()
+
+def test_get_files_with_wildcard_pattern(tmp_path, settings):
+    src = tmp_path / "source"
+    src.mkdir()
+    (src / "img_01.png").write_text("fake_data")
+    (src / "img_1.png").write_text("fake_data")
+    (src / "photo.jpg").write_text("fake_data")
+    (src / "photo.JPG").write_text("fake_data")
+
+    operation = MoveOperation(settings=settings, src=str(src), dst=str(tmp_path), pattern=("img_??.png", "*.jpg"))
+    files_for_task = operation.get_files(source_directory=operation.source_directory, pattern=operation.pattern)
+
+    names = sorted(file.name for file in files_for_task)
+    assert names == ["img_01.png", "photo.jpg"]
+
+def test_get_files_resolves_symlinks(tmp_path, settings):
+    src = tmp_path / "source"
+    src.mkdir()
+    target = src / "image.jpg"
+    target.write_text("fake_data")
+    (src / "a_link.jpg").symlink_to(target)
+    outside = tmp_path / "outside.jpg"
+    outside.write_text("fake_data")
+    (src / "b_link.jpg").symlink_to(outside)
+
+    operation = MoveOperation(settings=settings, src=str(src), dst=str(tmp_path), pattern=(".jpg",))
+    files_for_task = operation.get_files(source_directory=operation.source_directory, pattern=operation.pattern)
+
+    assert sorted(files_for_task) == sorted([target.resolve(), outside.resolve()])
@@ -8,6 +8,10 @@ class MockLogger:
     def __init__(self):
         self.warnings = []
         self.infos = []
+        self.debugs = []
+
+    def debug(self, msg: str):
+        self.debugs.append(msg)
 
     def warning(self, msg: str):
         self.warnings.append(msg)
@@ -84,3 +88,17 @@ def test_remove_all_invalid_type(remover):
     """Test that _remove_all raises TypeError for invalid input."""
     with pytest.raises(TypeError, match="filepaths should be a list or a tuple or a Path"):
         remover.remove_all("not a path")
+
+
+def test_remove_all_logs_summary(remover, tmp_path):
+    """Each removal is logged at debug level, missing files are warned about, and one summary is logged"""
+    file1 = tmp_path / "file1.txt"
+    file1.write_text("1")
+    missing = tmp_path / "missing.txt"
+
+    remover.remove_all([file1, missing])
+
+    assert not file1.exists()
+    assert remover.logger.debugs == [f"{file1} removed"]
+    assert remover.logger.warnings == [f"{missing} file not exists, skipping"]
+    assert remover.logger.infos == ["Removed 1 of 2 files"]
@@ -0,0 +1,30 @@
+import pytest
+import numpy as np
+from pathlib import Path
+from tools.comparer.img_comparer.hasher.hash_set import HashSet
+
+
+def test_from_dict_round_trip():
+    """Paths and hashes keep their order and values through from_dict and to_dict."""
+    hash_map = {
+        Path("1.jpg"): np.array([1, 2], dtype=np.uint8),
+        Path("2.jpg"): np.array([3, 4], dtype=np.uint8),
+    }
+
+    hash_set = HashSet.from_dict(hash_map)
+
+    assert hash_set.paths == (Path("1.jpg"), Path("2.jpg"))
+    assert hash_set.hashes.shape == (2, 2)
+    assert Path("2.jpg") in hash_set
+    assert np.array_equal(hash_set[Path("2.jpg")], [3, 4])
+    assert {path: h.tolist() for path, h in hash_set.to_dict().items()} == {
+        path: h.tolist() for path, h in hash_map.items()
+    }
+
+
+def test_empty_and_mismatched_columns():
+    """An empty map gives an empty set, misaligned columns are rejected."""
+    assert len(HashSet.from_dict({})) == 0
+
+    with pytest.raises(ValueError):
+        HashSet(paths=(Path("1.jpg"),), hashes=np.zeros((2, 8), dtype=np.uint8))
@@ -71,4 +71,28 @@ def test_metrics_types(create_test_image):
     metrics = ImageContentAnalyzer.analyze_metrics(img_path)
 
     for key in metrics:
-        assert isinstance(metrics[key], float)
\ No newline at end of file
+        assert isinstance(metrics[key], float)
+
+def test_metrics_match_numpy_reference(create_test_image):
+    """Fused OpenCV statistics give the same rounded values as NumPy mean, std and Laplacian variance"""
+    img_path = create_test_image("reference.png")
+    image_gray = cv2.cvtColor(cv2.imread(str(img_path)), cv2.COLOR_BGR2GRAY)
+
+    metrics = ImageContentAnalyzer.analyze_metrics(img_path)
+
+    assert metrics[ImageStatsKeys.im_brightness] == round(float(np.mean(image_gray)), 2)
+    assert metrics[ImageStatsKeys.im_contrast] == round(float(np.std(image_gray)), 2)
+    assert metrics[ImageStatsKeys.im_blur_score] == round(float(cv2.Laplacian(image_gray, cv2.CV_64F).var()), 2)
+
+
+def test_color_png_matches_bgr_conversion(tmp_path):
+    """Non-JPEG images are converted with cvtColor, so their brightness is not shifted by the decoder"""
+    rng = np.random.default_rng(0)
+    img_path = tmp_path / "color.png"
+    cv2.imwrite(str(img_path), rng.integers(0, 256, (64, 64, 3), dtype=np.uint8))
+    image_gray = cv2.cvtColor(cv2.imread(str(img_path)), cv2.COLOR_BGR2GRAY)
+
+    metrics = ImageContentAnalyzer.analyze_metrics(img_path)
+
+    assert metrics[ImageStatsKeys.im_brightness] == round(float(np.mean(image_gray)), 2)
+    assert metrics[ImageStatsKeys.im_blur_score] == round(float(cv2.Laplacian(image_gray, cv2.CV_64F).var()), 2)
@@ -0,0 +1,112 @@
+import pandas as pd
+import pytest
+from unittest.mock import MagicMock, patch
+
+from const_utils.stats_constansts import ImageStatsKeys
+from tools.stats.dataset_reporter.image_reporter import ImageDatasetReporter
+
+
+@pytest.fixture
+def reporter(settings, tmp_path):
+    """ImageDatasetReporter with a small report schema and a mocked logger"""
+    schema = [
+        {"title": "GEOMETRY", "type": "numeric", "columns": [ImageStatsKeys.object_area]},
+        {"title": "POSITION", "type": "binary", "columns": [ImageStatsKeys.object_in_center]},
+    ]
+    local_settings = settings.model_copy(update={"img_dataset_report_schema": schema, "report_path": tmp_path})
+    reporter = ImageDatasetReporter(local_settings)
+    reporter.logger = MagicMock()
+    return reporter
+
+
+@pytest.fixture
+def stats_df():
+    """Three objects of two classes on two images"""
+    df = pd.DataFrame({
+        ImageStatsKeys.class_name: ["dog", "cat", "dog"],
+        ImageStatsKeys.im_path: ["a.jpg", "a.jpg", "b.jpg"],
+        ImageStatsKeys.object_area: [100.0, 400.0, 300.0],
+        f"outlier_{ImageStatsKeys.object_area}": [0, 1, 0],
+        ImageStatsKeys.object_width: [10.0, 20.0, 15.0],
+    })
+    for column in ImageDatasetReporter.SPATIAL_GRID_COLUMNS:
+        df[column] = 0
+    df[ImageStatsKeys.object_in_center] = [1, 0, 0]
+    return df
+
+
+@pytest.mark.parametrize("categorical", [False, True])
+def test_console_report_renders_each_class_once(reporter, stats_df, categorical):
+    """Classes are reported in sorted order with statistics of their own rows only"""
+    if categorical:
+        stats_df[ImageStatsKeys.class_name] = stats_df[ImageStatsKeys.class_name].astype("category")
+    reporter.show_console_report(stats_df, "voc")
+    report = reporter.logger.info.call_args.args[0]
+
+    assert "Total images             :  2" in report
+    assert report.index(">>> CLASS: cat (33.3%)") < report.index(">>> CLASS: dog (66.7%)")
+    dog_section = report[report.index(">>> CLASS: dog"):]
+    assert "med     200.00" in dog_section
+    assert f"{ImageStatsKeys.object_in_center:<25}:          1 (  50.0%)" in dog_section
+
+
+@pytest.mark.parametrize("categorical", [False, True])
+def test_visual_report_spatial_grids(reporter, stats_df, categorical):
+    """Each class gets a 3x3 grid of its object positions in row-major order"""
+    if categorical:
+        stats_df[ImageStatsKeys.class_name] = stats_df[ImageStatsKeys.class_name].astype("category")
+    stats_df[ImageStatsKeys.object_in_right_bottom] = [0, 1, 1]
+
+    with patch("tools.stats.dataset_reporter.image_reporter.StatsPlotter") as plotter:
+        reporter.generate_visual_report(
+            stats_df, [ImageStatsKeys.object_area, ImageStatsKeys.object_width], reporter.report_path
+        )
+
+    grids = {call.args[1]: call.args[0] for call in plotter.plot_spatial_heatmap.call_args_list}
+    assert grids == {
+        "Spatial Density: CAT": [[0, 0, 0], [0, 0, 0], [0, 0, 1]],
+        "Spatial Density: DOG": [[0, 0, 0], [0, 1, 0], [0, 0, 1]],
+    }
+
+
+@pytest.mark.parametrize("width_gap", [False, True])
+def test_visual_report_bias_matrix_matches_dummies(reporter, stats_df, width_gap):
+    """The class vs feature bias matrix equals the correlation of pandas one-hot columns with the features"""
+    stats_df.loc[3] = stats_df.loc[1]
+    stats_df.loc[3, [ImageStatsKeys.object_area, ImageStatsKeys.object_width]] = [50.0, 25.0]
+    stats_df.loc[4] = stats_df.loc[0]
+    stats_df.loc[4, [ImageStatsKeys.class_name, ImageStatsKeys.object_area]] = [None, 70.0]
+    if width_gap:
+        stats_df.loc[2, ImageStatsKeys.object_width] = float("nan")
+    features = [ImageStatsKeys.object_area, ImageStatsKeys.object_width]
+
+    with patch("tools.stats.dataset_reporter.image_reporter.StatsPlotter") as plotter:
+        reporter.generate_visual_report(stats_df, features, reporter.report_path)
+
+    dummies = pd.get_dummies(stats_df[ImageStatsKeys.class_name], prefix="class").astype(int)
+    expected = pd.concat([stats_df[features], dummies], axis=1).corr().loc[dummies.columns, features]
+    bias_matrix = plotter.plot_correlation_matrix.call_args_list[0].args[0]
+
+    pd.testing.assert_frame_equal(bias_matrix, expected)
+
+
+def test_render_section_counts_outliers_per_column(reporter, stats_df):
+    """Outlier counts come from the matching outlier column, a column without flags counts zero"""
+    section = {"title": "GEOMETRY", "type": "numeric",
+               "columns": [ImageStatsKeys.object_area, ImageStatsKeys.object_width]}
+
+    lines = reporter._render_section(stats_df, section, len(stats_df))
+
+    assert "outliers: 1 " in lines[1]
+    assert "outliers: 0 " in lines[2]
+
+
+def test_render_section_sweet_spot_limits(reporter, stats_df):
+    """Sweet spot limits follow the IQR rule and the lower limit is never negative"""
+    section = {"title": "GEOMETRY", "type": "numeric", "columns": [ImageStatsKeys.object_area]}
+    dogs = stats_df[stats_df[ImageStatsKeys.class_name] == "dog"]
+
+    lines = reporter._render_section(dogs, section, len(dogs))
+
+    # q25 = 150, q75 = 250: 150 - 1.5 * 100 = 0 and 250 + 1.5 * 100 = 400
+    assert lines[1].endswith("      0.00 < sweet spot <     400.00 ")
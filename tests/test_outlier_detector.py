@@ -67,4 +67,33 @@ def test_data_integrity_types():
     result = OutlierDetector.mark_outliers(df, ["object_area"])
 
     assert result["outlier_object_area"].dtype == "int8"
-    assert result["outlier_any"].dtype == "int8"
\ No newline at end of file
+    assert result["outlier_any"].dtype == "int8"
+
+def test_columns_are_checked_against_their_own_class_limits():
+    """All columns share one grouped pass, yet every value is compared with its own class and column limits"""
+    df = pd.DataFrame({
+        ImageStatsKeys.class_name: ["a"] * 6 + ["b"] * 6 + [None],
+        "col1": [1, 2, 1, 2, 1, 50, 100, 101, 99, 100, 102, 98, 1000],
+        "col2": [5, 5, 6, 5, 6, 5, 1, 2, 1, 2, 1, 30, 1000],
+    })
+
+    result = OutlierDetector.mark_outliers(df, ["col1", "col2", "missing_col"])
+
+    assert result["outlier_col1"].tolist() == [0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0]
+    assert result["outlier_col2"].tolist() == [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0]
+    assert "outlier_missing_col" not in result.columns
+
+
+def test_outlier_any_is_recomputed_from_current_flags():
+    """Stale outlier flags from an earlier run (e.g. cached rows) do not keep outlier_any set"""
+    df = pd.DataFrame({
+        "class_name": ["a"] * 6,
+        "col1": [1, 2, 1, 2, 1, 2],
+        "outlier_col1": [1, 0, 0, 0, 0, 0],
+        "outlier_any": [1, 0, 0, 0, 0, 0],
+    })
+
+    result = OutlierDetector.mark_outliers(df, ["col1"])
+
+    assert result["outlier_col1"].tolist() == [0] * 6
+    assert result["outlier_any"].tolist() == [0] * 6
@@ -114,6 +114,37 @@ def test_incremental_logic_updates_on_mtime_change(voc_stats, tmp_path):
         assert df_result.iloc[0][ImageStatsKeys.mtime] > old_mtime
 
 
+def test_incremental_logic_drops_deleted_files_from_cache(voc_stats, tmp_path):
+    """Test the incremental logic: rows of deleted files are removed from the saved cache."""
+    kept_file = tmp_path / "kept.xml"
+    kept_file.touch()
+    kept_path = str(kept_file.resolve())
+    deleted_path = str((tmp_path / "deleted.xml").resolve())
+
+    df_cached = pd.DataFrame([
+        {ImageStatsKeys.path: kept_path, ImageStatsKeys.mtime: kept_file.stat().st_mtime, "class_name": "tank"},
+        {ImageStatsKeys.path: deleted_path, ImageStatsKeys.mtime: 0.0, "class_name": "car"},
+    ])
+
+    def load(cache_file, columns=None, filters=None):
+        """Emulates the column and row selection of a parquet read."""
+        df = df_cached
+        for column, _, values in filters or ():
+            df = df[df[column].isin(values)]
+        return df[columns] if columns else df
+
+    voc_stats.cache_io.load.side_effect = load
+
+    with patch("tools.stats.base_stats.ProcessPoolExecutor") as mock_executor:
+        df_result = voc_stats.get_features((kept_file,))
+
+        mock_executor.assert_not_called()
+
+    voc_stats.cache_io.save_dataframe.assert_called_once()
+    df_saved = voc_stats.cache_io.save_dataframe.call_args[0][0]
+    assert df_saved[ImageStatsKeys.path].tolist() == [kept_path]
+    assert df_result[ImageStatsKeys.path].tolist() == [kept_path]
+
 def test_feature_extractor_edge_case():
     """Math test: object truncated by image edge."""
     from tools.stats.extractor import FeatureExtractor
@@ -124,4 +155,69 @@ def test_feature_extractor_edge_case():
     results = FeatureExtractor.extract_features(Path("test.xml"), data, margin_threshold=5)
 
     assert results[0]["truncated_left"] == 1
-    assert results[0]["truncated_right"] == 0
\ No newline at end of file
+    assert results[0]["truncated_right"] == 0
+
+def test_file_mtimes_resolves_paths_in_input_order(tmp_path, monkeypatch):
+    """mtimes are keyed by resolved paths, keep the input order and skip missing files."""
+    for name in ("b.xml", "a.xml"):
+        (tmp_path / name).touch()
+    monkeypatch.chdir(tmp_path)
+
+    mtimes = VOCStats._file_mtimes((Path("b.xml"), Path("missing.xml"), Path("a.xml")))
+
+    assert list(mtimes) == [str((tmp_path / "b.xml").resolve()), str((tmp_path / "a.xml").resolve())]
+    assert mtimes[str((tmp_path / "a.xml").resolve())] == (tmp_path / "a.xml").stat().st_mtime
+
+
+def test_compute_umap_coords_projects_only_new_rows(voc_stats, tmp_path):
+    """With a stored model and few new rows, only those rows are transformed and nothing is refitted"""
+    n_rows = 20
+    df = pd.DataFrame({"a": range(n_rows), "b": [i % 3 for i in range(n_rows)]}, dtype=float)
+    df["umap_x"] = 1.0
+    df["umap_y"] = 2.0
+    df.loc[n_rows - 1, ["umap_x", "umap_y"]] = float("nan")
+
+    reducer = MagicMock()
+    reducer.transform.return_value = [[7.0, 8.0]]
+    scaler = MagicMock()
+    voc_stats.cache_io.load_model.return_value = {"columns": ["a", "b"], "scaler": scaler, "reducer": reducer}
+
+    with patch("tools.stats.base_stats.UMAP") as mock_umap:
+        result = voc_stats.compute_umap_coords(df, ["a", "b"], model_file=tmp_path / "model.joblib")
+
+    mock_umap.assert_not_called()
+    assert list(scaler.transform.call_args.args[0].index) == [n_rows - 1]
+    assert result.loc[n_rows - 1, ["umap_x", "umap_y"]].tolist() == [7.0, 8.0]
+    assert result.loc[0, ["umap_x", "umap_y"]].tolist() == [1.0, 2.0]
+    voc_stats.cache_io.save_model.assert_not_called()
+
+
+def test_compute_umap_coords_refits_when_features_change(voc_stats, tmp_path):
+    """A stored model fitted on other columns is ignored, the data is fitted again and the model is saved"""
+    n_rows = 20
+    df = pd.DataFrame({"a": range(n_rows), "b": [i % 3 for i in range(n_rows)]}, dtype=float)
+    df["umap_x"] = 1.0
+    df["umap_y"] = 2.0
+    voc_stats.cache_io.load_model.return_value = {"columns": ["a", "c"], "scaler": None, "reducer": None}
+
+    with patch("tools.stats.base_stats.UMAP") as mock_umap:
+        mock_umap.return_value.fit_transform.side_effect = lambda x: x * 0 + 5.0
+        result = voc_stats.compute_umap_coords(df, ["a", "b"], model_file=tmp_path / "model.joblib")
+
+    mock_umap.return_value.fit_transform.assert_called_once()
+    assert (result["umap_x"] == 5.0).all()
+    assert voc_stats.cache_io.save_model.call_args.args[0]["columns"] == ["a", "b"]
+
+def test_file_mtimes_keys_symlinks_by_target(tmp_path):
+    """Symlinked files are keyed by their resolved target, as cached rows are."""
+    target_dir = tmp_path / "store"
+    target_dir.mkdir()
+    target = target_dir / "real.xml"
+    target.touch()
+    link_dir = tmp_path / "annotations"
+    link_dir.mkdir()
+    (link_dir / "link.xml").symlink_to(target)
+
+    mtimes = VOCStats._file_mtimes((link_dir / "link.xml",))
+
+    assert mtimes == {str(target.resolve()): target.stat().st_mtime}
@@ -0,0 +1,35 @@
+import cv2
+import numpy as np
+import pytest
+
+from tools.video_slicer import VideoSlicer
+
+
+@pytest.fixture
+def video_file(tmp_path):
+    """A 10 fps MJPG video of 25 frames, the frame number is encoded in the pixel brightness"""
+    video_path = tmp_path / "clip.avi"
+    writer = cv2.VideoWriter(str(video_path), cv2.VideoWriter_fourcc(*"MJPG"), 10, (64, 48))
+    for frame_id in range(25):
+        writer.write(np.full((48, 64, 3), frame_id * 10, dtype=np.uint8))
+    writer.release()
+    return video_path
+
+
+def test_slice_saves_every_step_frame(video_file, tmp_path):
+    """With step=1s at 10 fps frames 0, 10 and 20 are saved in order"""
+    target_dir = tmp_path / "frames"
+    target_dir.mkdir()
+
+    sliced, count = VideoSlicer().slice(video_file, target_dir, suffix=".png", step=1)
+
+    assert sliced is True
+    assert count == 3
+    for img_id, frame_id in enumerate((0, 10, 20)):
+        image = cv2.imread(str(target_dir / f"clip_{img_id}.png"))
+        assert abs(int(image.mean()) - frame_id * 10) <= 3
+
+
+def test_slice_missing_video(tmp_path):
+    """A video that cannot be opened gives no images"""
+    assert VideoSlicer().slice(tmp_path / "missing.avi", tmp_path) == (False, 0)
@@ -4,6 +4,7 @@ import cv2
 from pathlib import Path
 from unittest.mock import MagicMock
 from tools.annotation_converter.converter.yolo_voc_converter import YoloVocConverter
+from tools.annotation_converter.writer.voc import XMLWriter
 
 
 @pytest.fixture
@@ -41,7 +42,8 @@ def test_img_path_setter_logic(converter, tmp_path):
 
 def test_math_yolo_to_voc_conversion(converter, tmp_path, mock_dependencies):
     """Test of math yolo to voc conversion accuracy"""
-    reader, writer = mock_dependencies
+    reader, _ = mock_dependencies
+    writer = XMLWriter()
 
     # create test image 100 x 100
     img_dir = tmp_path / "images"
@@ -69,14 +71,13 @@ def test_math_yolo_to_voc_conversion(converter, tmp_path, mock_dependencies):
     # Assert
     assert success is True
 
-    args, *data = writer.write.call_args
-    xml_dict = data[0]
+    xml = (tmp_path / "out" / "test.xml").read_text()
 
-    assert "xmin>40</xmin" in xml_dict["data"]
-    assert "xmax>60</xmax" in xml_dict["data"]
-    assert "ymin>40</ymin" in xml_dict["data"]
-    assert "ymax>60</ymax" in xml_dict["data"]
-    assert "name>car</name" in xml_dict["data"]
+    assert "xmin>40</xmin" in xml
+    assert "xmax>60</xmax" in xml
+    assert "ymin>40</ymin" in xml
+    assert "ymax>60</ymax" in xml
+    assert "name>car</name" in xml
 
 
 def test_worker_skips_missing_images(converter, tmp_path, mock_dependencies):
@@ -101,7 +102,8 @@ def test_worker_skips_missing_images(converter, tmp_path, mock_dependencies):
 ])
 def test_truncated_flag_logic(converter, tmp_path, mock_dependencies, yolo_line, expected_truncated):
     """Test automatic definition of truncated objects"""
-    reader, writer = mock_dependencies
+    reader, _ = mock_dependencies
+    writer = XMLWriter()
 
     img_dir = tmp_path / "images"
     img_dir.mkdir(exist_ok=True)
@@ -120,5 +122,93 @@ def test_truncated_flag_logic(converter, tmp_path, mock_dependencies, yolo_line,
         suffix=".xml"
     )
 
-    _, *args = writer.write.call_args
-    assert f"<truncated>{expected_truncated}</truncated>" in args[0]["data"]
\ No newline at end of file
+    xml = (tmp_path / "out" / "test.xml").read_text()
+    assert f"<truncated>{expected_truncated}</truncated>" in xml
+
+def test_build_image_map_filters_extensions(converter, tmp_path):
+    """Only files with supported extensions get into the image map, matched case-insensitively"""
+    img_dir = tmp_path / "images"
+    img_dir.mkdir()
+    for name in ("a.jpg", "b.PNG", "c.txt"):
+        (img_dir / name).touch()
+
+    images = converter._build_image_map()
+
+    assert set(images) == {"a", "b"}
+    assert images["a"] == str((img_dir / "a.jpg").resolve())
+
+
+def test_extensions_setter_normalizes_case_and_dot(converter):
+    """Extensions are lowercased and dot-prefixed once in the setter"""
+    converter.extensions = ["JPG", ".Png", ".jpg"]
+
+    assert converter.extensions == ("JPG", ".Png", ".jpg")
+    assert converter._extensions_lower == (".jpg", ".png")
+
+
+def test_to_voc_dict_multiple_objects(tmp_path):
+    """Several YOLO lines become a list of VOC objects with mapped names"""
+    from services.convertion_utils import to_voc_dict
+
+    img_path = tmp_path / "test.jpg"
+    cv2.imwrite(str(img_path), np.zeros((100, 200, 3), dtype=np.uint8))
+
+    result = to_voc_dict(
+        annotations=["0 0.5 0.5 0.2 0.2", "1 0.1 0.9 0.2 0.2"],
+        correspond_img=str(img_path),
+        class_mapping={"0": "car"}
+    )
+    objects = result["annotation"]["object"]
+
+    assert [obj["name"] for obj in objects] == ["car", "object_1"]
+    assert objects[0]["bndbox"] == {"xmin": 80, "ymin": 40, "xmax": 120, "ymax": 60}
+    assert [obj["truncated"] for obj in objects] == [0, 1]
+
+
+def test_to_voc_dict_keeps_class_id_verbatim(tmp_path):
+    """Class IDs are looked up in the mapping exactly as written in the label file"""
+    from services.convertion_utils import to_voc_dict
+
+    img_path = tmp_path / "test.jpg"
+    cv2.imwrite(str(img_path), np.zeros((100, 200, 3), dtype=np.uint8))
+
+    result = to_voc_dict(
+        annotations=["01 0.5 0.5 0.2 0.2"],
+        correspond_img=str(img_path),
+        class_mapping={"01": "car", "1": "truck"}
+    )
+
+    assert result["annotation"]["object"]["name"] == "car"
+
+
+def test_to_voc_dict_empty_annotations(tmp_path, recwarn):
+    """An empty label file gives an empty dict without a loadtxt warning"""
+    from services.convertion_utils import to_voc_dict
+
+    img_path = tmp_path / "test.jpg"
+    cv2.imwrite(str(img_path), np.zeros((100, 200, 3), dtype=np.uint8))
+
+    assert to_voc_dict(annotations=[], correspond_img=str(img_path), class_mapping={}) == {}
+    assert len(recwarn) == 0
+
+def test_convert_single_job_runs_in_process(converter, tmp_path, monkeypatch):
+    """With n_jobs=1 no process pool is created and files are converted in place"""
+    labels_dir = tmp_path / "labels"
+    labels_dir.mkdir()
+    img_dir = tmp_path / "images"
+    img_dir.mkdir()
+    cv2.imwrite(str(img_dir / "test.jpg"), np.zeros((100, 100, 3), dtype=np.uint8))
+    (labels_dir / "classes.txt").write_text("car\n")
+    (labels_dir / "test.txt").write_text("0 0.5 0.5 0.2 0.2\n")
+
+    def fail_pool(*args, **kwargs):
+        raise AssertionError("ProcessPoolExecutor must not be used for n_jobs=1")
+
+    monkeypatch.setattr(
+        "tools.annotation_converter.converter.yolo_voc_converter.ProcessPoolExecutor", fail_pool
+    )
+
+    out_dir = tmp_path / "out"
+    converter.convert(tuple(labels_dir.iterdir()), out_dir, n_jobs=1)
+
+    assert "name>car</name" in (out_dir / "test.xml").read_text()
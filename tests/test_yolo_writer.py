@@ -0,0 +1,10 @@
+from tools.annotation_converter.writer.yolo import YoloWriter
+
+
+def test_write_skips_empty_lines(tmp_path):
+    """Empty records are dropped and every record ends with a newline"""
+    file_path = tmp_path / "labels" / "a.txt"
+
+    YoloWriter().write(["0 0.5 0.5 0.1 0.1", "", "1 0.2 0.2 0.1 0.1"], file_path)
+
+    assert file_path.read_text() == "0 0.5 0.5 0.1 0.1\n1 0.2 0.2 0.1 0.1\n"
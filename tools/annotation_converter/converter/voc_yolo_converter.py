@@ -168,7 +168,8 @@ class VocYOLOConverter(BaseConverter):
         Args:
             file_paths (Tuple[Path, ...]): Collection of source annotation files.
             target_path (Path): Directory path for the converted output.
-            n_jobs (int): Number of parallel workers to use. Defaults to 1.
+            n_jobs (int): Number of parallel workers to use. Defaults to 1. With a single
+                worker both phases run in the current process without a pool.
         """
         count_to_convert = len(file_paths)
 
@@ -179,8 +180,11 @@ class VocYOLOConverter(BaseConverter):
 
         classes_func = partial(self._get_classes_worker, reader=self.reader)
 
-        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
-            classes = list(executor.map(classes_func, file_paths))
+        if n_jobs == 1:
+            classes = list(map(classes_func, file_paths))
+        else:
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                classes = list(executor.map(classes_func, file_paths))
 
         self.objects = sorted(set().union(*classes))
         class_mapping = {name: i for i, name in enumerate(self.objects)}
@@ -198,9 +202,12 @@ class VocYOLOConverter(BaseConverter):
 
         self.logger.info(f"converting {count_to_convert} annotations with {n_jobs} workers...")
         converted_count = 0
-        with ProcessPoolExecutor(max_workers=n_jobs) as executor:
-            converted_results = executor.map(worker_func, file_paths)
-            converted_count = sum(converted_results)
+        if n_jobs == 1:
+            converted_count = sum(map(worker_func, file_paths))
+        else:
+            with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+                converted_results = executor.map(worker_func, file_paths)
+                converted_count = sum(converted_results)
 
         self.logger.info(f"Converted {converted_count}/{count_to_convert} annotations and saved in {target_path}")
 
@@ -1,11 +1,11 @@
+import os
 from concurrent.futures import ProcessPoolExecutor
 from functools import partial
 from pathlib import Path
 from typing import Dict, Tuple, Union, Optional
 
-import xmltodict
-
 from services.convertion_utils import to_voc_dict
+from services.process_context import worker_mp_context
 from tools.annotation_converter.converter.base import BaseConverter
 from tools.annotation_converter.reader.base import BaseReader
 from tools.annotation_converter.writer.base import BaseWriter
@@ -70,7 +70,8 @@ class YoloVocConverter(BaseConverter):
         The main logic for converting one YOLO file to one VOC XML file.
 
         It reads the YOLO data, finds the matching image to get its dimensions,
-        recalculates coordinates into pixel values, and saves the final XML.
+        recalculates coordinates into pixel values, and passes the VOC dictionary
+        to the writer, which streams the XML straight to disk.
 
         Args:
             file_path (Path): Path to the source YOLO annotation file.
@@ -100,10 +101,12 @@ class YoloVocConverter(BaseConverter):
             correspond_img=correspond_img_str
         )
 
+        if not converted_dict:
+            return False
+
         try:
-            xml = xmltodict.unparse(converted_dict, pretty=True)
             annotation_path = Path(destination_path / f"{file_path.stem}{suffix}")
-            writer.write(data=xml, file_path=annotation_path)
+            writer.write(data=converted_dict, file_path=annotation_path)
         except Exception:
             return False
         return True
@@ -118,7 +121,8 @@ class YoloVocConverter(BaseConverter):
         Args:
             file_paths (Tuple[Path]): List of paths to the annotation files.
             target_path (Path): Directory where converted files will be stored.
-            n_jobs (int): Number of parallel workers to use. Defaults to 1.
+            n_jobs (int): Number of parallel workers to use. Defaults to 1. With a single
+                worker the conversion runs in the current process without a pool.
         """
         target_path.mkdir(exist_ok=True, parents=True)
         classes_file = next((path for path in file_paths if path.name == self.CLASSES_FILE), None)
@@ -133,7 +137,7 @@ class YoloVocConverter(BaseConverter):
         )
         self.object_mapping = self.reader.read(classes_file)
         self.object_mapping = {value: key for key, value in self.object_mapping.items()}
-        images = {img.stem: str(img.resolve()) for img in self.img_path.iterdir() if img.suffix.lower() in self.extensions}
+        images = self._build_image_map()
 
         convert_func = partial(
             self.__class__._convert_worker,
@@ -144,17 +148,44 @@ class YoloVocConverter(BaseConverter):
             suffix=self.dest_suffix
         )
 
-        with ProcessPoolExecutor(
-                max_workers=n_jobs,
-                initializer=self.__class__._init_worker,
-                initargs=(images,)
-        ) as executor:
-            converted_results = executor.map(convert_func, file_paths)
-            converted_count = sum(converted_results)
+        if n_jobs == 1:
+            self.__class__._init_worker(images)
+            converted_count = sum(map(convert_func, file_paths))
+        else:
+            mp_context = worker_mp_context()
+            chunksize = max(1, count_to_convert // (n_jobs * 4))
+
+            with ProcessPoolExecutor(
+                    max_workers=n_jobs,
+                    mp_context=mp_context,
+                    initializer=self.__class__._init_worker,
+                    initargs=(images,)
+            ) as executor:
+                converted_results = executor.map(convert_func, file_paths, chunksize=chunksize)
+                converted_count = sum(converted_results)
 
         self.logger.info(f"Converted {converted_count}/{count_to_convert} annotations from YOLO to VOC")
 
 
+    def _build_image_map(self) -> Dict[str, str]:
+        """
+        Builds a lookup table of image stems to absolute image paths.
+
+        The image directory is resolved once and scanned with os.scandir, so no
+        per-file Path objects or resolve() calls are made.
+
+        Returns:
+            Dict[str, str]: A dictionary mapping image names (without extension) to their paths.
+        """
+        base = str(self.img_path.resolve())
+
+        with os.scandir(base) as entries:
+            return {
+                os.path.splitext(entry.name)[0]: os.path.join(base, entry.name)
+                for entry in entries
+                if entry.name.lower().endswith(self._extensions_lower)
+            }
+
     @property
     def img_path(self) -> Path:
         """Path: Returns the directory path where images are stored."""
@@ -194,6 +225,9 @@ class YoloVocConverter(BaseConverter):
         """
         Sets the valid image extensions for the converter.
 
+        Alongside the original tuple, a lowercased copy with a guaranteed leading dot
+        is stored once, so directory scans never normalize extensions per file.
+
         Args:
             value (Tuple[str, ...]): A tuple of extension strings (e.g., ('.jpg',)).
 
@@ -209,3 +243,7 @@ class YoloVocConverter(BaseConverter):
                 msg = f"extensions must be convertable into tuple, got {type(value)}"
                 self.logger.error(msg)
                 raise TypeError(msg)
+
+        self._extensions_lower = tuple(
+            dict.fromkeys(f".{ext.lower().lstrip('.')}" for ext in self._extensions)
+        )
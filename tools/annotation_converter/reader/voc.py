@@ -15,6 +15,9 @@ class XMLReader(BaseReader):
         """
         Reads the content of an XML file and converts it into a structured dictionary.
 
+        Raw bytes are handed to the expat parser as is, so the text is not decoded
+        into a str and encoded back to UTF-8 for every file.
+
         Args:
             file_path (Path): The path to the source XML file.
 
@@ -25,5 +28,5 @@ class XMLReader(BaseReader):
             FileNotFoundError: If the XML file is not found at the given path.
             xmltodict.ParsingInterrupted: If the XML content is not valid or corrupted.
         """
-        data = xmltodict.parse(file_path.read_text())
+        data = xmltodict.parse(file_path.read_bytes())
         return data
\ No newline at end of file
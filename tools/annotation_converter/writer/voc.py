@@ -1,4 +1,7 @@
 from pathlib import Path
+from typing import Union
+
+import xmltodict
 
 from tools.annotation_converter.writer.base import BaseWriter
 
@@ -6,17 +9,22 @@ class XMLWriter(BaseWriter):
     """
     A writer class for saving annotations in the Pascal VOC XML format.
 
-    This class takes processed XML strings (typically generated by a converter)
-    and writes them to the file system as standard .xml files for object
-    detection datasets. It handles the creation of necessary directories.
+    This class takes either a ready XML string or a VOC-style dictionary
+    (typically generated by a converter) and writes it to the file system as
+    a standard .xml file for object detection datasets. It handles the creation
+    of necessary directories.
     """
-    def write(self, data: str, file_path: Path) -> None:
+    def write(self, data: Union[str, dict], file_path: Path) -> None:
         """
-        Writes an XML annotation string to the specified file path.
+        Writes an XML annotation to the specified file path.
         This method automatically creates any missing parent directories.
 
+        When a dictionary is passed, the XML is emitted straight into the opened
+        file element by element, so the full document string is never built in memory.
+
         Args:
-            data (str): A string containing the formatted XML data.
+            data (Union[str, dict]): A string containing the formatted XML data or
+                a dictionary following the VOC XML schema.
             file_path (Path): The target destination where the file will be saved.
 
         Raises:
@@ -25,4 +33,7 @@ class XMLWriter(BaseWriter):
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
         with open(file_path, "w") as file:
-            file.write(data)
\ No newline at end of file
+            if isinstance(data, dict):
+                xmltodict.unparse(data, output=file, pretty=True)
+            else:
+                file.write(data)
@@ -18,7 +18,8 @@ class YoloWriter(BaseWriter):
 
         This method automatically creates any missing parent directories.
         It filters out empty lines and adds a newline character after
-        each record.
+        each record. The whole content is joined and encoded once and written
+        with a single call instead of line by line.
 
         Args:
             data (List[str]): A list of strings, where each string represents
@@ -35,5 +36,8 @@ class YoloWriter(BaseWriter):
         """
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(file_path, "w") as file:
-            file.writelines(f"{line}\n" for line in data if line)
+        lines = [line for line in data if line]
+        payload = ("\n".join(lines) + "\n").encode("utf-8") if lines else b""
+
+        with open(file_path, "wb") as file:
+            file.write(payload)
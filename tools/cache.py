@@ -1,8 +1,14 @@
 import hashlib
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Union, Any
+from itertools import islice
+from typing import Dict, Optional, Union, Any, Iterator, Sequence, Tuple, List
+import joblib
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 from const_utils.default_values import AppSettings
 from logger.logger import LoggerConfigurator
@@ -19,10 +25,26 @@ class CacheIO:
 
     Attributes:
         SUFFIX (str): The standard file extension for cache files (.parquet).
+        MODEL_SUFFIX (str): File extension for fitted models stored next to a cache file.
+        HASH_COLUMN (str): Name of the column holding bit-packed hashes.
+        MTIME_COLUMN (str): Name of the column holding file modification times (ns).
+        SIZE_COLUMN (str): Name of the column holding file sizes in bytes.
+        COMPRESSION (str): Parquet codec used for cached columns.
+        COMPRESSION_LEVEL (int): Compression level for the codec.
+        ROW_GROUP_SIZE (int): Number of rows built and written per parquet row group.
+        EMPTY_MSG (str): Warning logged when there is nothing to save.
         settings (AppSettings): Global configuration instance.
         logger (logging.Logger): Logger instance for tracking I/O operations.
     """
     SUFFIX = ".parquet"
+    MODEL_SUFFIX = ".joblib"
+    HASH_COLUMN = "hash"
+    MTIME_COLUMN = "mtime_ns"
+    SIZE_COLUMN = "size"
+    COMPRESSION = "zstd"
+    COMPRESSION_LEVEL = 3
+    ROW_GROUP_SIZE = 65536
+    EMPTY_MSG = "data_map is empty, skipping saving cache data"
 
     def __init__(self, settings: AppSettings):
         """
@@ -39,12 +61,23 @@ class CacheIO:
         )
 
 
-    def load(self: LoggerProtocol, cache_file: Path) -> pd.DataFrame:
+    def load(
+            self: LoggerProtocol,
+            cache_file: Path,
+            columns: Optional[List[str]] = None,
+            filters: Optional[List[Tuple[str, str, Any]]] = None
+    ) -> pd.DataFrame:
         """
         Loads data from a parquet cache file into a DataFrame.
 
+        Only the requested columns are decoded, and row filters are pushed down to
+        the parquet reader, so rows that do not match are dropped while reading.
+
         Args:
             cache_file (Path): The path to the .parquet file.
+            columns (Optional[List[str]]): Columns to read. Reads all columns if None.
+            filters (Optional[List[Tuple[str, str, Any]]]): Row filters in
+                pyarrow's (column, op, value) form, e.g. [("path", "in", paths)].
 
         Returns:
             pd.DataFrame: The loaded data or an empty DataFrame if the file
@@ -55,20 +88,98 @@ class CacheIO:
             return pd.DataFrame()
 
         try:
-            self.logger.info(f"Loading cache file {cache_file}")
-            df = pd.read_parquet(cache_file)
-
-            return df
+            return self._read_table(cache_file, columns=columns, filters=filters).to_pandas()
         except Exception as e:
             self.logger.error(f"Cache file {cache_file.name} is corrupted: {e}. Deleting.")
             cache_file.unlink(missing_ok=True)
             return pd.DataFrame()
 
+    def load_hashmap(
+            self: LoggerProtocol,
+            cache_file: Path
+    ) -> Tuple[Dict[Path, np.ndarray], Dict[Path, Tuple[int, int]]]:
+        """
+        Loads a hash cache written by save_hashmap.
+
+        The packed hash column is read as one (N, hash bytes) np.uint8 matrix straight
+        from the Arrow buffer, so neither pandas nor a per-row loop is involved. The
+        matrix is copied out of the mapped file, because the same file may be
+        rewritten while the hashes are still in use.
+
+        Args:
+            cache_file (Path): The path to the .parquet file.
+
+        Returns:
+            Tuple[Dict[Path, np.ndarray], Dict[Path, Tuple[int, int]]]: Mapping of image
+                paths to packed np.uint8 hashes and mapping of image paths to the
+                (mtime_ns, size) they were hashed at. Both are empty if the file is
+                missing or corrupted, the second one if the cache holds no file stats.
+        """
+        if not cache_file.exists():
+            self.logger.warning(f"Cache file {cache_file} does not exist")
+            return {}, {}
+
+        try:
+            table = self._read_table(cache_file)
+            hashes = table.column(self.HASH_COLUMN).combine_chunks()
+
+            if not pa.types.is_fixed_size_binary(hashes.type):
+                raise TypeError(f"'{self.HASH_COLUMN}' column must be fixed size binary, got {hashes.type}")
+
+            n_bytes = hashes.type.byte_width
+            matrix = np.frombuffer(
+                hashes.buffers()[1], dtype=np.uint8, count=len(hashes) * n_bytes, offset=hashes.offset * n_bytes
+            ).reshape(-1, n_bytes).copy()
+            paths = list(map(Path, table.column("path").to_pylist()))
+
+            file_stats = {}
+            if self.MTIME_COLUMN in table.column_names and self.SIZE_COLUMN in table.column_names:
+                file_stats = dict(zip(paths, zip(
+                    table.column(self.MTIME_COLUMN).to_pylist(), table.column(self.SIZE_COLUMN).to_pylist()
+                )))
+
+            return dict(zip(paths, matrix)), file_stats
+        except Exception as e:
+            self.logger.error(f"Cache file {cache_file.name} is corrupted: {e}. Deleting.")
+            cache_file.unlink(missing_ok=True)
+            return {}, {}
+
+    def _read_table(
+            self: LoggerProtocol,
+            cache_file: Path,
+            columns: Optional[List[str]] = None,
+            filters: Optional[List[Tuple[str, str, Any]]] = None
+    ) -> pa.Table:
+        """
+        Reads a parquet cache file into an Arrow table.
+
+        The file is memory-mapped, so the OS pages in only the data that is actually
+        decoded instead of copying the whole file into a heap buffer first. If mapping
+        is not possible (e.g., on some network filesystems), a regular read is used.
+
+        Args:
+            cache_file (Path): The path to the .parquet file.
+            columns (Optional[List[str]]): Columns to read. Reads all columns if None.
+            filters (Optional[List[Tuple[str, str, Any]]]): Row filters pushed down to the reader.
+
+        Returns:
+            pa.Table: The file contents.
+        """
+        self.logger.info(f"Loading cache file {cache_file}")
+        try:
+            return pq.read_table(cache_file, columns=columns, filters=filters, memory_map=True)
+        except OSError as e:
+            self.logger.warning(f"Memory mapping of {cache_file.name} failed: {e}. Reading it into memory.")
+            return pq.read_table(cache_file, columns=columns, filters=filters)
+
 
     def save(self: LoggerProtocol, data_map: Union[Dict[Path, np.ndarray], pd.DataFrame], cache_file: Path) -> None:
         """
         Saves a dictionary of hashes or a pandas DataFrame to a parquet file.
 
+        This is a thin facade that dispatches to save_hashmap or save_dataframe;
+        callers that know their data type can call those directly.
+
         Args:
             data_map (Union[Dict[Path, np.ndarray], pd.DataFrame]): Data to store.
             cache_file (Path): Target path for the cache file.
@@ -76,37 +187,215 @@ class CacheIO:
         Raises:
             TypeError: If the data_map is not a dictionary or a DataFrame.
         """
-        empty_msg = "data_map is empty, skipping saving cache data"
-
         if isinstance(data_map, dict):
-            if not data_map:
-                self.logger.warning(empty_msg)
-                return
-            data = [
-                {'path': str(p), 'hash': h.tolist()}
-                for p, h in data_map.items()
-            ]
-            df = pd.DataFrame(data)
-
+            self.save_hashmap(data_map, cache_file)
         elif isinstance(data_map, pd.DataFrame):
-            if data_map.empty:
-                self.logger.warning(empty_msg)
-                return
-            df = data_map
+            self.save_dataframe(data_map, cache_file)
         else:
             msg = f"data_map must be either a dictionary or a DataFrame, got {type(data_map)}"
             self.logger.warning(msg)
             raise TypeError(msg)
 
+    def save_hashmap(
+            self: LoggerProtocol,
+            hash_map: Dict[Path, np.ndarray],
+            cache_file: Path,
+            file_stats: Optional[Dict[Path, Tuple[int, int]]] = None
+    ) -> None:
+        """
+        Saves a dictionary of image hashes to a parquet file.
+
+        Hashes are stored as raw bytes: packed np.uint8 hashes as they are, boolean
+        hashes are bit-packed first (8 bits per byte).
+
+        Args:
+            hash_map (Dict[Path, np.ndarray]): Mapping of image paths to packed np.uint8
+                or boolean hashes.
+            cache_file (Path): Target path for the cache file.
+            file_stats (Optional[Dict[Path, Tuple[int, int]]]): (mtime_ns, size) of the
+                hashed files. If given, they are stored next to the hashes; files
+                without stats get (-1, -1).
+        """
+        if not hash_map:
+            self.logger.warning(self.EMPTY_MSG)
+            return
+
+        self._write_tables(self._iter_hash_tables(hash_map, file_stats), len(hash_map), cache_file)
+
+    def save_dataframe(self: LoggerProtocol, df: pd.DataFrame, cache_file: Path) -> None:
+        """
+        Saves a pandas DataFrame to a parquet file.
+
+        Args:
+            df (pd.DataFrame): Data to store.
+            cache_file (Path): Target path for the cache file.
+        """
+        if df.empty:
+            self.logger.warning(self.EMPTY_MSG)
+            return
+
+        self._write_tables(iter([pa.Table.from_pandas(df, preserve_index=False)]), len(df), cache_file)
+
+    def load_model(self: LoggerProtocol, model_file: Path) -> Optional[Any]:
+        """
+        Loads a fitted model that was stored with save_model.
+
+        Args:
+            model_file (Path): The path to the .joblib file.
+
+        Returns:
+            Optional[Any]: The stored object, or None if the file is missing or corrupted.
+        """
+        if not model_file.exists():
+            return None
+
+        try:
+            return joblib.load(model_file)
+        except Exception as e:
+            self.logger.error(f"Model file {model_file.name} is corrupted: {e}. Deleting.")
+            model_file.unlink(missing_ok=True)
+            return None
+
+    def save_model(self: LoggerProtocol, model: Any, model_file: Path) -> None:
+        """
+        Stores a fitted model (any picklable object) next to the cache files.
+
+        Args:
+            model (Any): The object to store.
+            model_file (Path): Target path for the .joblib file.
+        """
+        model_file.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            joblib.dump(model, model_file)
+            self.logger.info(f"Model saved successfully to {model_file}.")
+        except Exception as e:
+            self.logger.error(f"Critical error saving model: {e}")
+
+    def _write_tables(self: LoggerProtocol, tables: Iterator[pa.Table], count: int, cache_file: Path) -> None:
+        """
+        Streams Arrow tables into one parquet file, one row group at a time.
+
+        Args:
+            tables (Iterator[pa.Table]): Non-empty iterator of tables sharing one schema.
+            count (int): Total number of rows, used for logging.
+            cache_file (Path): Target path for the cache file.
+        """
         cache_file.parent.mkdir(parents=True, exist_ok=True)
-        self.logger.info(f"Saving {len(data_map)} hashes to {cache_file.name}")
+        self.logger.info(f"Saving {count} hashes to {cache_file.name}")
 
         try:
-            df.to_parquet(cache_file, engine="pyarrow", compression="snappy", index=False)
+            first_table = next(tables)
+            with pq.ParquetWriter(cache_file, first_table.schema, **self._write_options(first_table)) as writer:
+                writer.write_table(first_table, row_group_size=self.ROW_GROUP_SIZE)
+                for table in tables:
+                    writer.write_table(table, row_group_size=self.ROW_GROUP_SIZE)
             self.logger.info(f"Cache saved successfully to {cache_file}.")
         except Exception as e:
             self.logger.error(f"Critical error saving cache: {e}")
 
+    @classmethod
+    def _write_options(cls, table: pa.Table) -> Dict[str, Any]:
+        """
+        Chooses per-column parquet compression and encoding for a table.
+
+        Every column is ZSTD-compressed with dictionary encoding, which shrinks the
+        highly redundant path and class name columns. Packed binary hashes are
+        high-entropy data, so they are stored PLAIN and uncompressed.
+
+        Args:
+            table (pa.Table): The table that is about to be written.
+
+        Returns:
+            Dict[str, Any]: Keyword arguments for pq.write_table.
+        """
+        names = table.column_names
+        packed_hash = cls.HASH_COLUMN in names and pa.types.is_fixed_size_binary(
+            table.schema.field(cls.HASH_COLUMN).type
+        )
+        plain_columns = {cls.HASH_COLUMN} if packed_hash else set()
+
+        return {
+            "compression": {
+                name: "none" if name in plain_columns else cls.COMPRESSION for name in names
+            },
+            "compression_level": {
+                name: cls.COMPRESSION_LEVEL for name in names if name not in plain_columns
+            },
+            "use_dictionary": [name for name in names if name not in plain_columns],
+            "column_encoding": {name: "PLAIN" for name in plain_columns} or None,
+        }
+
+    @classmethod
+    def _iter_hash_tables(
+            cls,
+            data_map: Dict[Path, np.ndarray],
+            file_stats: Optional[Dict[Path, Tuple[int, int]]] = None
+    ) -> Iterator[pa.Table]:
+        """
+        Converts a hash map into Arrow tables of at most ROW_GROUP_SIZE rows each.
+
+        Only one chunk of hashes is stacked and packed at a time, so the peak memory
+        of saving does not grow with the size of the whole map.
+
+        Args:
+            data_map (Dict[Path, np.ndarray]): Mapping of image paths to hashes
+                of equal length.
+            file_stats (Optional[Dict[Path, Tuple[int, int]]]): (mtime_ns, size) of the
+                hashed files.
+
+        Yields:
+            pa.Table: Tables with 'path' and 'hash' columns, plus 'mtime_ns' and 'size'
+                columns if file_stats are given.
+        """
+        items = iter(data_map.items())
+
+        while chunk := list(islice(items, cls.ROW_GROUP_SIZE)):
+            paths, hashes = zip(*chunk)
+            stats = None if file_stats is None else [file_stats.get(path, (-1, -1)) for path in paths]
+            yield cls._hashes_to_table(paths, hashes, stats)
+
+    @classmethod
+    def _hashes_to_table(
+            cls,
+            paths: Sequence[Path],
+            hashes: Sequence[np.ndarray],
+            stats: Optional[Sequence[Tuple[int, int]]] = None
+    ) -> pa.Table:
+        """
+        Builds an Arrow table straight from columnar arrays of paths and packed hashes.
+
+        All hashes are stacked into one 2D block (boolean blocks are bit-packed at once),
+        the packed bytes are handed to Arrow as a single FixedSizeBinary buffer.
+
+        Args:
+            paths (Sequence[Path]): Image paths.
+            hashes (Sequence[np.ndarray]): Packed np.uint8 or boolean hashes of equal
+                length, aligned with paths.
+            stats (Optional[Sequence[Tuple[int, int]]]): (mtime_ns, size) per path.
+
+        Returns:
+            pa.Table: A table with 'path' and 'hash' columns, plus 'mtime_ns' and 'size'
+                columns if stats are given.
+        """
+        matrix = np.stack(hashes)
+        packed = np.packbits(matrix, axis=1) if matrix.dtype == bool else matrix.astype(np.uint8, copy=False)
+        packed = np.ascontiguousarray(packed)
+        count, n_bytes = packed.shape
+
+        packed_hashes = pa.FixedSizeBinaryArray.from_buffers(
+            pa.binary(n_bytes), count, [None, pa.py_buffer(packed)]
+        )
+        columns = [pa.array([str(path) for path in paths], type=pa.string()), packed_hashes]
+        names = ["path", cls.HASH_COLUMN]
+
+        if stats is not None:
+            mtimes, sizes = zip(*stats)
+            columns += [pa.array(mtimes, type=pa.int64()), pa.array(sizes, type=pa.int64())]
+            names += [cls.MTIME_COLUMN, cls.SIZE_COLUMN]
+
+        return pa.Table.from_arrays(columns, names=names)
+
 
     @classmethod
     def generate_cache_filename(cls, source_path: Path, cache_name: Optional[Union[str, Path]], **kwargs: Any) -> str:
@@ -126,8 +415,7 @@ class CacheIO:
 
         if cache_name is None:
 
-            abs_path = str(source_path.resolve())
-            path_hash = hashlib.md5(abs_path.encode('utf-8')).hexdigest()
+            path_hash = cls._path_fingerprint(os.path.abspath(source_path))
             folder_name = str(source_path.name.replace(' ', '_').strip("."))[:30]
             return f"cache_{path_hash}_{folder_name}{full_suffix}"
         else:
@@ -137,3 +425,22 @@ class CacheIO:
 
             cache_name = f"{cache_name}_{full_suffix}"
             return cache_name
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _path_fingerprint(abs_path: str) -> str:
+        """
+        Returns the md5 fingerprint of a fully resolved directory path.
+
+        Results are memoized per absolute path string, so repeated cache name lookups
+        skip the resolve() stat calls and the hashing.
+
+        Args:
+            abs_path (str): Absolute (not necessarily resolved) path of the directory.
+
+        Returns:
+            str: Hex digest of the resolved path.
+        """
+        resolved = str(Path(abs_path).resolve())
+        # md5 only fingerprints the folder name, it is not used for security
+        return hashlib.md5(resolved.encode('utf-8'), usedforsecurity=False).hexdigest()
@@ -1,16 +1,66 @@
+import math
 import multiprocessing
+import os
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from pathlib import Path
 from typing import Union, Tuple, Dict, List, Set, Optional
-from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from functools import partial
+from multiprocessing.shared_memory import SharedMemory
 
+import cv2
 import numpy as np
-import pandas as pd
 
 from const_utils.default_values import AppSettings
 from logger.logger import LoggerConfigurator
+from services.process_context import worker_mp_context
 from tools.cache import CacheIO
+from tools.comparer.img_comparer.hasher.hash_set import HashSet
+
+
+_M1 = np.uint64(0x5555555555555555)
+_M2 = np.uint64(0x3333333333333333)
+_M4 = np.uint64(0x0F0F0F0F0F0F0F0F)
+_H01 = np.uint64(0x0101010101010101)
+
+
+def _popcount(words: np.ndarray) -> np.ndarray:
+    """
+    Counts set bits of every np.uint64 word element-wise.
+
+    Uses np.bitwise_count (hardware POPCNT, NumPy >= 2.0) when it is available and
+    falls back to the word-parallel SWAR bit count otherwise, which works on whole
+    64-bit words instead of gathering a lookup table byte by byte.
+
+    Args:
+        words (np.ndarray): Array of np.uint64 words.
+
+    Returns:
+        np.ndarray: np.uint32 array of the same shape with per-word bit counts.
+    """
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words).astype(np.uint32)
+
+    words = words - ((words >> np.uint64(1)) & _M1)
+    words = (words & _M2) + ((words >> np.uint64(2)) & _M2)
+    words = (words + (words >> np.uint64(4))) & _M4
+    return ((words * _H01) >> np.uint64(56)).astype(np.uint32)
+
+
+def _popcount_rows(words: np.ndarray) -> np.ndarray:
+    """
+    Counts set bits along the last axis of an array of uint64 words.
+
+    Args:
+        words (np.ndarray): Array of np.uint64 words.
+
+    Returns:
+        np.ndarray: Number of set bits per row, with the last axis reduced.
+    """
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.uint32)
+    return _popcount(words).sum(axis=-1, dtype=np.uint32)
 
 
 class BaseHasher(ABC):
@@ -29,7 +79,21 @@ class BaseHasher(ABC):
         threshold (int): The distance threshold in bits for duplicate detection.
         cache_io (CacheIO): Tool for saving and loading hash data from disk.
         n_jobs (int): Number of parallel processes for hash computation.
+        COMPARE_TILE_BYTES (int): Size budget of one XOR tile in find_duplicates, chosen
+            so that a tile and its operands stay within the CPU cache.
+        CACHE_VERSION (int): Version of the cached hash layout, part of the cache file name.
+        MIN_BAND_BITS (int): Narrowest bit band for which band bucketing is used in
+            find_duplicates; narrower bands put too many hashes into one bucket.
+        MAX_CANDIDATE_RATIO (float): Share of all pairs above which band candidates are
+            dropped in favour of comparing all pairs.
+        PAIR_CHUNK (int): Number of candidate pairs verified at once.
     """
+    COMPARE_TILE_BYTES = 1 << 22
+    MIN_BAND_BITS = 8
+    MAX_CANDIDATE_RATIO = 0.125
+    PAIR_CHUNK = 1 << 20
+    CACHE_VERSION = 5
+
     def __init__(
         self,
         settings: AppSettings,
@@ -68,7 +132,8 @@ class BaseHasher(ABC):
             core_size (int): Resolution for resizing before hashing.
 
         Returns:
-            np.ndarray: A 1D boolean array representing the image hash.
+            np.ndarray: A 1D np.uint8 array with the bit-packed image hash
+                (see np.packbits).
         """
         pass
 
@@ -76,35 +141,57 @@ class BaseHasher(ABC):
     def validate_hash_map(
             self,
             image_paths: Tuple[Path],
-            hash_map: Dict[Path, np.ndarray]
+            hash_map: Dict[Path, np.ndarray],
+            file_stats: Optional[Dict[Path, Tuple[int, int]]] = None,
+            cached_stats: Optional[Dict[Path, Tuple[int, int]]] = None
     ) -> Tuple[bool, Dict[Path, np.ndarray]]:
         """
         Synchronizes the loaded cache with the current files in the directory.
 
         It removes hashes for files that no longer exist and triggers
-        re-calculation for new files found on the disk.
+        re-calculation for new files found on the disk. If file stats are given,
+        files whose (mtime_ns, size) differ from the cached ones are edited in
+        place and are re-hashed as well.
 
         Args:
             image_paths (Tuple[Path]): Current list of image paths from the folder.
             hash_map (Dict[Path, np.ndarray]): The hash map loaded from cache.
+            file_stats (Optional[Dict[Path, Tuple[int, int]]]): Current (mtime_ns, size)
+                of the files on disk.
+            cached_stats (Optional[Dict[Path, Tuple[int, int]]]): (mtime_ns, size) of the
+                files when they were hashed, as loaded from cache.
 
         Returns:
             Tuple[bool, Dict[Path, np.ndarray]]: A tuple containing a sync
                 status (True if matches 1:1) and the updated hash map.
         """
         paths_set = set(image_paths)
-        cached_set = set(hash_map.keys())
-        missing_paths = tuple(paths_set - cached_set)
+        cached_set = hash_map.keys()  # a live set-like view, not a copy
+        stale_paths = set()
+
+        if file_stats is not None and cached_stats is not None:
+            stale_paths = {
+                path for path in paths_set & cached_set if file_stats.get(path) != cached_stats.get(path)
+            }
+
+        missing_paths = tuple(paths_set.difference(cached_set) | stale_paths)
         obsolete_paths = cached_set - paths_set
 
         if not missing_paths and not obsolete_paths:
             self.logger.info(f"Cache matches disk 1:1 ({len(hash_map)} items).")
             return True, hash_map
 
-        valid_cache = {path: hash_data for path, hash_data in hash_map.items() if path in paths_set}
+        # filtering hash_map (instead of iterating paths_set & cached_set) keeps the cache order,
+        # which decides which image of a duplicate group is kept
+        valid_cache = {
+            path: hash_data for path, hash_data in hash_map.items()
+            if path in paths_set and path not in stale_paths
+        }
 
         if missing_paths:
-            self.logger.info(f"Syncing cache: calculating {len(missing_paths)} new images...")
+            self.logger.info(
+                f"Syncing cache: calculating {len(missing_paths)} new images ({len(stale_paths)} changed)..."
+            )
             new_hashes = self.update_hashes(missing_paths)
 
             for path, hash_data in zip(missing_paths, new_hashes):
@@ -113,52 +200,138 @@ class BaseHasher(ABC):
 
         return False, valid_cache
 
+    @staticmethod
+    def _file_stats(image_paths: Tuple[Path, ...]) -> Dict[Path, Tuple[int, int]]:
+        """
+        Collects (mtime_ns, size) of every image, scanning each directory once.
+
+        Args:
+            image_paths (Tuple[Path, ...]): Image paths to look up.
+
+        Returns:
+            Dict[Path, Tuple[int, int]]: Stats of every image that could be read.
+        """
+        paths_by_dir = defaultdict(dict)
+        for path in image_paths:
+            paths_by_dir[path.parent][path.name] = path
+
+        file_stats = {}
+        for directory, names in paths_by_dir.items():
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        path = names.get(entry.name)
+                        if path is None:
+                            continue
+                        try:
+                            stat = entry.stat()
+                        except OSError:
+                            continue
+                        file_stats[path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                continue
+
+        return file_stats
+
 
     def update_hashes(self, image_paths: Tuple[Path, ...]) -> list:
         """
         Computes hashes for a list of images using multiple CPU cores.
 
+        Workers write each packed hash straight into a shared memory slab of shape
+        (N, ceil(core_size * core_size / 8)) at the image's position and only send
+        back a success flag, so no arrays are pickled between processes. Paths are
+        dispatched in chunks of about N / (4 * n_jobs) to cut per-task IPC.
+
         Args:
             image_paths (Tuple[Path, ...]): List of images that need new hashes.
 
         Returns:
-            list: A list of generated NumPy arrays (hashes).
+            list: A list of generated NumPy arrays (hashes), with None for
+                images that could not be hashed.
         """
-        hash_func = partial(self.__class__.compute_hash, core_size=self.core_size)
+        if not image_paths:
+            return []
 
-        with ProcessPoolExecutor(max_workers=self.n_jobs) as executor:
-            hashes = list(executor.map(hash_func, image_paths))
+        shape = (len(image_paths), self.hash_bytes)
+        shm = SharedMemory(create=True, size=max(1, shape[0] * shape[1]))
 
-        return hashes
+        try:
+            hash_func = partial(self.__class__._hash_worker, core_size=self.core_size)
+            mp_context = worker_mp_context()
+            chunksize = max(1, shape[0] // (self.n_jobs * 4))
+
+            with ProcessPoolExecutor(
+                    max_workers=self.n_jobs,
+                    mp_context=mp_context,
+                    initializer=self.__class__._init_worker,
+                    initargs=(shm.name, shape)
+            ) as executor:
+                # plain strings pickle smaller and faster than Path objects
+                is_hashed = list(executor.map(
+                    hash_func, range(shape[0]), map(str, image_paths), chunksize=chunksize
+                ))
+
+            hashes_block = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf).copy()
+        finally:
+            shm.close()
+            shm.unlink()
+
+        return [hashes_block[idx] if ok else None for idx, ok in enumerate(is_hashed)]
+
+    @classmethod
+    def _init_worker(cls, shm_name: str, shape: Tuple[int, int]) -> None:
+        """
+        Attaches a worker process to the shared hash slab once per process.
 
+        OpenCV is limited to one thread, since the pool already runs one worker per core.
 
-    @staticmethod
-    def _df_to_hash_map(df: pd.DataFrame) -> Dict[Path, np.ndarray]:
-        """Internal helper: Converts Parquet DataFrame back to Hashing format."""
-        if df.empty:
-            return {}
-        data = {
-            Path(row['path']): np.array(row['hash'], dtype=bool)
-            for _, row in df.iterrows()
-        }
-        return data
+        Args:
+            shm_name (str): Name of the shared memory block created by the parent.
+            shape (Tuple[int, int]): Shape (N, hash length) of the hash slab.
+        """
+        cv2.setNumThreads(1)
+        cls._worker_shm = SharedMemory(name=shm_name)
+        cls._worker_hashes = np.ndarray(shape, dtype=np.uint8, buffer=cls._worker_shm.buf)
+
+    @classmethod
+    def _hash_worker(cls, index: int, image_path: Union[str, Path], core_size: int) -> bool:
+        """
+        Computes a hash for one image and stores it in the shared slab.
 
+        Args:
+            index (int): Row of the slab reserved for this image.
+            image_path (Union[str, Path]): Path to the image file.
+            core_size (int): Resolution for resizing before hashing.
 
-    def get_hashmap(self, image_paths: Tuple[Path]) -> Dict[Path, np.ndarray]:
+        Returns:
+            bool: True if the hash was computed and stored, False otherwise.
+        """
+        image_hash = cls.compute_hash(image_path, core_size)
+
+        if image_hash is None or image_hash.size != cls._worker_hashes.shape[1]:
+            return False
+
+        cls._worker_hashes[index] = image_hash
+        return True
+
+
+    def get_hashmap(self, image_paths: Tuple[Path]) -> HashSet:
         """
         Orchestrates the process of obtaining hashes for the entire directory.
 
         It attempts to load data from cache, validates it against the current
-        files, and computes any missing hashes in parallel.
+        files (their paths, modification times and sizes), and computes any
+        missing or outdated hashes in parallel.
 
         Args:
             image_paths (Tuple[Path]): All image paths to be processed.
 
         Returns:
-            Dict[Path, np.ndarray]: A complete dictionary of paths and their hashes.
+            HashSet: Paths and their hashes as aligned columns.
         """
         if not image_paths:
-            return {}
+            return HashSet()
 
         image_count = len(image_paths)
         filename = self.cache_io.generate_cache_filename(
@@ -166,23 +339,23 @@ class BaseHasher(ABC):
             cache_name=self.settings.cache_name,
             hash_type=self.hash_type,
             core_size=self.core_size,
+            version=self.CACHE_VERSION,
 
         )
 
         cache_file_name = self.settings.cache_file_path / filename
         cache_file_name.parent.mkdir(parents=True, exist_ok=True)
-        df = self.cache_io.load(cache_file_name)
-
-        hash_map  = self._df_to_hash_map(df)
+        hash_map, cached_stats = self.cache_io.load_hashmap(cache_file_name)
+        file_stats = self._file_stats(image_paths)
 
         if hash_map:
-            is_valid, valid_hash_map = self.validate_hash_map(image_paths, hash_map)
+            is_valid, valid_hash_map = self.validate_hash_map(image_paths, hash_map, file_stats, cached_stats)
             if is_valid:
-                return hash_map
+                return HashSet.from_dict(hash_map)
             else:
-                self.cache_io.save(valid_hash_map, cache_file_name)
+                self.cache_io.save_hashmap(valid_hash_map, cache_file_name, file_stats)
                 self.logger.info(f"Hash map updated: {len(valid_hash_map)} total valid hashes.")
-                return valid_hash_map
+                return HashSet.from_dict(valid_hash_map)
 
         self.logger.info(f"Building hashmap in parallel using {self.n_jobs} workers for {image_count} images...")
 
@@ -193,20 +366,237 @@ class BaseHasher(ABC):
         }
 
         self.logger.info(f"Successfully hashed {len(hash_map)} out of {image_count} images")
-        self.cache_io.save(hash_map, cache_file_name)
-        return hash_map
+        self.cache_io.save_hashmap(hash_map, cache_file_name, file_stats)
+        return HashSet.from_dict(hash_map)
 
 
-    def find_duplicates(self, hashmap: Dict[Path, np.ndarray]) -> List[Path]:
+    @staticmethod
+    def _pack_words(matrix: np.ndarray) -> np.ndarray:
+        """
+        Packs a (N, D) hash matrix into 64-bit words.
+
+        Boolean matrices are bit-packed first, np.uint8 matrices are treated as
+        already packed hashes. Rows are zero-padded to a multiple of 8 bytes, so
+        every hash becomes ceil(D / 64) np.uint64 words. Padding bits are zero
+        in every row and never affect the Hamming distance.
+
+        Args:
+            matrix (np.ndarray): A 2D boolean array of hashes or a 2D np.uint8 array
+                of packed hashes.
+
+        Returns:
+            np.ndarray: A C-contiguous (N, W) np.uint64 array.
+        """
+        packed = np.packbits(matrix, axis=1) if matrix.dtype == bool else matrix.astype(np.uint8, copy=False)
+        pad = -packed.shape[1] % 8
+
+        if pad:
+            packed = np.pad(packed, ((0, 0), (0, pad)))
+
+        return np.ascontiguousarray(packed).view(np.uint64)
+
+    def _mark_tile(
+            self,
+            rows: np.ndarray,
+            packed: np.ndarray,
+            duplicates_mask: np.ndarray,
+            col_start: int,
+            tile: int
+    ) -> None:
+        """
+        Marks every column of one tile that lies within the threshold of any given row.
+
+        The distance is accumulated one 64-bit word at a time and pairs that already
+        exceed the threshold are dropped, so the remaining words are only compared
+        for the few candidate pairs. NumPy releases the GIL inside its kernels, so
+        tiles processed by different threads run on different cores.
+
+        Args:
+            rows (np.ndarray): Packed hashes of the rows that stayed unique.
+            packed (np.ndarray): The full packed hash matrix.
+            duplicates_mask (np.ndarray): Boolean duplicate flags, updated in place.
+            col_start (int): First column of the tile.
+            tile (int): Tile width.
+        """
+        cols = packed[col_start:min(col_start + tile, packed.shape[0])]
+
+        # the first word is compared for every pair, later words only for pairs still under the threshold
+        distances = _popcount(rows[:, None, 0] ^ cols[None, :, 0])
+        row_idx, col_idx = np.nonzero(distances <= self.threshold)
+        distances = distances[row_idx, col_idx]
+
+        for word in range(1, packed.shape[1]):
+            if not row_idx.size:
+                return
+            distances += _popcount(rows[row_idx, word] ^ cols[col_idx, word])
+            keep = distances <= self.threshold
+            row_idx, col_idx, distances = row_idx[keep], col_idx[keep], distances[keep]
+
+        duplicates_mask[col_start + col_idx] = True
+
+    def _band_matches(self, packed: np.ndarray, order: np.ndarray, later: np.ndarray) -> np.ndarray:
+        """
+        Verifies all candidate pairs of one band and returns those within the threshold.
+
+        Rows of a band are given sorted by their band value, so every row forms a
+        candidate pair with each of the following `later` rows. Pairs are expanded and
+        compared in chunks of at most PAIR_CHUNK pairs to keep memory bounded.
+
+        Args:
+            packed (np.ndarray): The full packed hash matrix.
+            order (np.ndarray): Row indices sorted by band value.
+            later (np.ndarray): For each sorted position, the number of following rows
+                that share its band value.
+
+        Returns:
+            np.ndarray: Matching pairs encoded as np.int64 `low * N + high`.
+        """
+        count = packed.shape[0]
+        positions = np.flatnonzero(later)
+        pair_ends = np.cumsum(later[positions])
+        matches = []
+        first = 0
+
+        while first < positions.size:
+            done = pair_ends[first - 1] if first else 0
+            last = max(first + 1, int(np.searchsorted(pair_ends, done + self.PAIR_CHUNK, side="right")))
+            chunk, pair_counts = positions[first:last], later[positions[first:last]]
+
+            left = np.repeat(chunk, pair_counts)
+            offsets = np.arange(left.size) - np.repeat(np.cumsum(pair_counts) - pair_counts, pair_counts)
+            rows, cols = order[left], order[left + 1 + offsets]
+
+            # as in _mark_tile, pairs are dropped as soon as their distance exceeds the threshold
+            distances = np.zeros(rows.size, dtype=np.uint32)
+            for word in range(packed.shape[1]):
+                distances += _popcount(packed[rows, word] ^ packed[cols, word])
+                keep = distances <= self.threshold
+                rows, cols, distances = rows[keep], cols[keep], distances[keep]
+
+            matches.append(np.minimum(rows, cols).astype(np.int64) * count + np.maximum(rows, cols))
+            first = last
+
+        return np.concatenate(matches) if matches else np.empty(0, dtype=np.int64)
+
+    def _banded_duplicates(self, bits: np.ndarray, packed: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Finds duplicates by comparing only hashes that share an exact bit band.
+
+        Hashes are split into threshold + 1 bands. Two hashes within the threshold
+        differ in at most threshold bits, so at least one of their bands is identical
+        (pigeonhole principle) and bucketing by band values loses no pair. Only pairs
+        sharing a bucket get a full Hamming distance, which replaces the N² scan with
+        roughly linear work when duplicates are rare.
+
+        Args:
+            bits (np.ndarray): A 2D boolean array with the hash bits, one row per image.
+            packed (np.ndarray): The same hashes packed into np.uint64 words.
+
+        Returns:
+            Optional[np.ndarray]: Boolean duplicate flags, or None if the bands are too
+                narrow or the buckets too crowded, so a full scan is cheaper.
+        """
+        count = packed.shape[0]
+        n_bands = self.threshold + 1
+
+        if bits.shape[1] // n_bands < self.MIN_BAND_BITS:
+            return None
+
+        orders, laters = [], []
+        for band in np.array_split(bits, n_bands, axis=1):
+            band_bytes = np.ascontiguousarray(np.packbits(band, axis=1))
+            keys = band_bytes.view(np.dtype((np.void, band_bytes.shape[1]))).ravel()
+            bucket_ids = np.unique(keys, return_inverse=True)[1].ravel()
+
+            order = np.argsort(bucket_ids, kind="stable")
+            sorted_ids = bucket_ids[order]
+            orders.append(order)
+            laters.append(np.searchsorted(sorted_ids, sorted_ids, side="right") - np.arange(count) - 1)
+
+        n_candidates = sum(int(later.sum()) for later in laters)
+        if n_candidates > self.MAX_CANDIDATE_RATIO * count * (count - 1) / 2:
+            self.logger.info(f"{n_candidates} band candidates are too many, comparing all pairs instead")
+            return None
+
+        with ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+            pairs = np.unique(np.concatenate(list(executor.map(partial(self._band_matches, packed), orders, laters))))
+
+        # pairs are sorted by their low row, which is the greedy order of the full scan
+        low, high = np.divmod(pairs, count)
+        duplicates_mask = np.zeros(count, dtype=bool)
+        starts = np.flatnonzero(np.r_[True, low[1:] != low[:-1]]) if low.size else np.empty(0, dtype=np.int64)
+
+        for start, stop in zip(starts, np.r_[starts[1:], low.size]):
+            if not duplicates_mask[low[start]]:
+                duplicates_mask[high[start:stop]] = True
+
+        return duplicates_mask
+
+    def _tiled_duplicates(self, packed: np.ndarray) -> np.ndarray:
+        """
+        Finds duplicates by comparing all pairs of hashes tile by tile.
+
+        Hamming distances are computed tile by tile (T x T hashes) with XOR and popcount,
+        so no Python loop runs over pairs and every tile stays cache resident. Only the
+        upper triangle of each diagonal tile is resolved row by row, and only for rows
+        that have a match there; the tiles to the right are reduced with a single
+        vectorized any() over the rows that stayed unique, spread over n_jobs threads.
+
+        Args:
+            packed (np.ndarray): The packed (N, W) np.uint64 hash matrix.
+
+        Returns:
+            np.ndarray: Boolean duplicate flags.
+        """
+        count, n_words = packed.shape
+        duplicates_mask = np.zeros(count, dtype=bool)
+        tile = max(1, math.isqrt(self.COMPARE_TILE_BYTES // (n_words * 8)))
+
+        with ThreadPoolExecutor(max_workers=self.n_jobs) as executor:
+            for start in range(0, count, tile):
+                stop = min(start + tile, count)
+                # rows already marked as duplicates never claim matches, so they are not compared at all
+                rows = np.flatnonzero(~duplicates_mask[start:stop]) + start
+                if not rows.size:
+                    continue
+
+                # the diagonal tile resolves the greedy order inside the block, only the upper
+                # triangle matters and only rows with at least one match there need a Python step
+                diagonal = _popcount_rows(packed[rows][:, None, :] ^ packed[None, start:stop, :]) <= self.threshold
+                diagonal &= np.arange(stop - start)[None, :] > (rows - start)[:, None]
+
+                for candidate in np.flatnonzero(diagonal.any(axis=1)):
+                    if duplicates_mask[rows[candidate]]:
+                        continue
+                    duplicates_mask[start:stop] |= diagonal[candidate]
+
+                # rows that stayed unique mark every later column they match, tile by tile
+                survivors = packed[rows[~duplicates_mask[rows]]]
+                if not survivors.size:
+                    continue
+
+                # tiles own disjoint column ranges of the mask, so they can be filled concurrently
+                list(executor.map(
+                    partial(self._mark_tile, survivors, packed, duplicates_mask, tile=tile),
+                    range(stop, count, tile)
+                ))
+
+        return duplicates_mask
+
+    def find_duplicates(self, hashmap: Union[HashSet, Dict[Path, np.ndarray]]) -> List[Path]:
         """
         Finds similar images using vectorized Hamming distance comparison.
 
-        This method converts the hash map into a matrix and compares all
-        images against each other. It optimizes the search by skipping
-        already identified duplicates.
+        Hashes (packed np.uint8 or plain boolean) are laid out as a (N, ceil(D / 64))
+        uint64 matrix. Candidate pairs are first narrowed down by exact bit bands (see
+        _banded_duplicates); when the threshold is too wide for that, all pairs are
+        compared tile by tile (see _tiled_duplicates). Both give the same result: images
+        are visited in order and an image already marked as a duplicate is skipped when
+        searching for its own matches.
 
         Args:
-            hashmap (Dict[Path, np.ndarray]): Dictionary of paths and hashes.
+            hashmap (Union[HashSet, Dict[Path, np.ndarray]]): Paths and hashes, either as
+                a HashSet or as a dictionary (converted with HashSet.from_dict).
 
         Returns:
             List[Path]: A list of file paths identified as duplicates.
@@ -214,37 +604,55 @@ class BaseHasher(ABC):
         Raises:
             ValueError: If hashes in the map have different lengths.
         """
-        if not hashmap:
+        if not len(hashmap):
             return []
 
+        if not isinstance(hashmap, HashSet):
+            try:
+                hashmap = HashSet.from_dict(hashmap)
+            except ValueError as e:
+                msg = "Failed to create matrix. Some hashes have different lengths!"
+                self.logger.error(msg)
+                raise ValueError(msg)
+
         self.logger.info(f"Vectorizing comparison for {len(hashmap)} images...")
-        paths: List[Path] = list(hashmap.keys())
+        packed = self._pack_words(hashmap.hashes)
+        bits = np.unpackbits(packed.view(np.uint8), axis=1, count=self._hash_bits(hashmap.hashes)).astype(bool)
 
-        try:
-            matrix = np.array(list(hashmap.values()), dtype=bool)
-        except ValueError as e:
-            msg = "Failed to create matrix. Some hashes have different lengths!"
-            self.logger.error(msg)
-            raise ValueError(msg)
+        duplicates_mask = self._banded_duplicates(bits, packed)
+        if duplicates_mask is None:
+            duplicates_mask = self._tiled_duplicates(packed)
 
-        duplicates_indices: Set[int] = set()
+        result = [hashmap.paths[idx] for idx in np.flatnonzero(duplicates_mask)]
+        self.logger.info(f"Vectorized search finished. Found {len(result)} duplicates.")
+        return result
 
-        for index in range(len(paths)):
-            if index in duplicates_indices:
-                continue
+    def _hash_bits(self, hashes: np.ndarray) -> int:
+        """
+        Returns the number of meaningful bits per hash.
 
-            current_hash = matrix[index]
-            hamming_distances = np.count_nonzero(matrix != current_hash, axis=1)
-            matches = np.where(hamming_distances <= self.threshold)[0]
+        Args:
+            hashes (np.ndarray): A 2D boolean array of hashes or a 2D np.uint8 array
+                of packed hashes.
 
-            for match_idx in matches:
-                if match_idx > index:
-                    duplicates_indices.add(int(match_idx))
+        Returns:
+            int: Hash length in bits, excluding the zero padding of packed hashes.
+        """
+        if hashes.dtype == bool:
+            return hashes.shape[1]
+
+        return self.hash_bits if self.hash_bytes == hashes.shape[1] else hashes.shape[1] * 8
 
-        result = [paths[idx] for idx in duplicates_indices]
-        self.logger.info(f"Vectorized search finished. Found {len(result)} duplicates.")
-        return result
 
+    @property
+    def hash_bits(self) -> int:
+        """int: The length of one hash in bits (core_size squared)."""
+        return self.core_size * self.core_size
+
+    @property
+    def hash_bytes(self) -> int:
+        """int: The length of one bit-packed hash in bytes."""
+        return -(-self.hash_bits // 8)
 
     @property
     def core_size(self) -> int:
@@ -316,9 +724,8 @@ class BaseHasher(ABC):
         Args:
             percentage (float): The threshold percentage (0-100).
         """
-        hash_sqr = self.core_size * self.core_size
-        self._threshold = int(hash_sqr * (percentage / self.settings.max_percentage))
-        self.logger.debug(f"Threshold recalculated: {percentage}% of {hash_sqr} bits = {self._threshold} bits")
+        self._threshold = int(self.hash_bits * (percentage / self.settings.max_percentage))
+        self.logger.debug(f"Threshold recalculated: {percentage}% of {self.hash_bits} bits = {self._threshold} bits")
 
     @property
     def n_jobs(self) -> int:
@@ -331,7 +738,9 @@ class BaseHasher(ABC):
         Safely sets the number of workers based on the system's CPU count.
 
         It ensures at least 1 worker is used and caps the value to
-        (CPU count - 1) to keep the system responsive.
+        (CPU count - 1) to keep the system responsive. The CPU count is the number
+        of cores this process may run on, so containers with a restricted CPU set
+        are not oversubscribed.
         """
         if not isinstance(value, int):
             try:
@@ -345,8 +754,8 @@ class BaseHasher(ABC):
                 self.logger.error(msg)
                 raise ValueError(msg)
 
-        # check cores and control that n_jobs can be set
-        cores = multiprocessing.cpu_count()
+        # check cores available to this process (cgroups/taskset may allow fewer than the machine has)
+        cores = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else multiprocessing.cpu_count()
 
         if value <= 1:
             self.logger.warning(f"n_jobs must be greater than 1, got {value}")
@@ -15,35 +15,74 @@ class DHash(BaseHasher):
     adjacent pixels in a resized version of the image. It is very effective
     at identifying visual similarities while ignoring minor changes in
     color or compression.
+
+    Attributes:
+        MIN_REDUCED_SCALE (int): Minimal number of decoded pixels per hash pixel
+            (per side) that a reduced decode must keep to be used.
+        REDUCED_READ_MODES (tuple): (scale divisor, cv2.imread flag) pairs from the
+            coarsest to the full scale grayscale decode.
+        REDUCED_READ_SUFFIXES (tuple): Lowercase suffixes of the formats that libjpeg
+            decodes at reduced scale; other formats are decoded in full and downscaled.
     """
+    MIN_REDUCED_SCALE = 4
+    REDUCED_READ_MODES = (
+        (8, cv2.IMREAD_REDUCED_GRAYSCALE_8),
+        (4, cv2.IMREAD_REDUCED_GRAYSCALE_4),
+        (2, cv2.IMREAD_REDUCED_GRAYSCALE_2),
+        (1, cv2.IMREAD_GRAYSCALE),
+    )
+    REDUCED_READ_SUFFIXES = (".jpg", ".jpeg")
+
     @staticmethod
-    def compute_hash(image_path: Path, core_size: int) -> Union[np.ndarray, None]:
+    def compute_hash(image_path: Union[str, Path], core_size: int) -> Union[np.ndarray, None]:
         """
         Calculates the dHash for a single image.
 
         The process includes:
-        1. Loading the image in grayscale.
+        1. Loading the image in grayscale. JPEGs are decoded straight at the
+           coarsest of 1/8, 1/4 or 1/2 scale (DCT scaling in libjpeg) that still
+           keeps MIN_REDUCED_SCALE pixels per hash pixel, which skips most of the
+           decoding work; smaller images are decoded at full size. Other formats
+           gain nothing from a reduced read and are decoded once at full size.
         2. Resizing it to (core_size + 1, core_size) to allow horizontal
-           pixel comparison.
+           pixel comparison. Images that already have this size are used as is.
         3. Generating a boolean mask where each bit represents whether the
            left pixel is brighter than the right pixel.
+        4. Packing the mask into bytes, 8 bits per byte.
 
         Args:
-            image_path (Path): The file path to the image.
+            image_path (Union[str, Path]): The file path to the image.
             core_size (int): The resolution used for resizing. The resulting
                 hash length will be core_size squared (e.g., 8x8 = 64 bits).
 
         Returns:
-            Union[np.ndarray, None]: A 1D NumPy array of boolean values
-                representing the hash, or None if the image file is
-                invalid or cannot be read.
+            Union[np.ndarray, None]: A 1D np.uint8 array of ceil(core_size² / 8)
+                bit-packed bytes representing the hash, or None if the image
+                file is invalid or cannot be read.
         """
-        image = cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
+        if Path(image_path).suffix.lower() in DHash.REDUCED_READ_SUFFIXES:
+            (coarsest, coarsest_flag), *finer_modes = DHash.REDUCED_READ_MODES
+            image = cv2.imread(str(image_path), coarsest_flag)
+
+            if image is not None:
+                # the coarsest decode tells the approximate full size, which picks the scale to decode at
+                height, width = image.shape[0] * coarsest, image.shape[1] * coarsest
+                for scale, flag in [(coarsest, coarsest_flag), *finer_modes]:
+                    if min(height // scale // core_size, width // scale // (core_size + 1)) >= DHash.MIN_REDUCED_SCALE:
+                        break
+
+                if scale != coarsest:
+                    image = cv2.imread(str(image_path), flag)
+        else:
+            image = cv2.imread(str(image_path), cv2.IMREAD_GRAYSCALE)
 
         if image is None:
             return None
 
-        resized_image = cv2.resize(image, (core_size + 1, core_size), interpolation=cv2.INTER_AREA)
+        if image.shape == (core_size, core_size + 1):
+            resized_image = image
+        else:
+            resized_image = cv2.resize(image, (core_size + 1, core_size), interpolation=cv2.INTER_AREA)
         gradient_difference = resized_image[:, 1:] > resized_image[:, :-1]
 
-        return gradient_difference.flatten()
+        return np.packbits(gradient_difference)
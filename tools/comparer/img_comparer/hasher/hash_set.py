@@ -0,0 +1,85 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Tuple, Optional, Iterator
+
+import numpy as np
+
+
+@dataclass
+class HashSet:
+    """
+    Column-oriented container of image hashes.
+
+    Paths and hashes are stored as two aligned columns instead of a Dict[Path, np.ndarray],
+    so the i-th image is simply paths[i] with hashes[i]. Iterating over hashes walks one
+    contiguous block of memory and comparisons work on row indices only. A path to index
+    lookup table is built lazily, on the first lookup by path.
+
+    Attributes:
+        paths (Tuple[Path, ...]): Image paths, aligned with the rows of hashes.
+        hashes (np.ndarray): A 2D (N, D) array of hashes, one row per image.
+    """
+    paths: Tuple[Path, ...] = ()
+    hashes: np.ndarray = field(default_factory=lambda: np.empty((0, 0), dtype=np.uint8))
+    _path_to_idx: Optional[Dict[Path, int]] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """
+        Validates that both columns describe the same number of images.
+
+        Raises:
+            ValueError: If hashes is not a 2D array with one row per path.
+        """
+        self.paths = tuple(self.paths)
+
+        if self.hashes.ndim != 2 or self.hashes.shape[0] != len(self.paths):
+            raise ValueError(
+                f"hashes must be a 2D array with {len(self.paths)} rows, got shape {self.hashes.shape}"
+            )
+
+    @classmethod
+    def from_dict(cls, hash_map: Dict[Path, np.ndarray]) -> "HashSet":
+        """
+        Builds a HashSet from a dictionary of paths and hashes.
+
+        Args:
+            hash_map (Dict[Path, np.ndarray]): Mapping of image paths to hashes of equal length.
+
+        Returns:
+            HashSet: A container with the same paths and hashes in insertion order.
+
+        Raises:
+            ValueError: If hashes in the map have different lengths.
+        """
+        if not hash_map:
+            return cls()
+
+        return cls(paths=tuple(hash_map.keys()), hashes=np.array(list(hash_map.values())))
+
+    def to_dict(self) -> Dict[Path, np.ndarray]:
+        """
+        Converts the container back to a dictionary of paths and hashes.
+
+        Returns:
+            Dict[Path, np.ndarray]: Mapping of image paths to their hash rows (views, not copies).
+        """
+        return dict(zip(self.paths, self.hashes))
+
+    @property
+    def path_to_idx(self) -> Dict[Path, int]:
+        """Dict[Path, int]: Lookup table of row indices by path, built on first access."""
+        if self._path_to_idx is None:
+            self._path_to_idx = {path: idx for idx, path in enumerate(self.paths)}
+        return self._path_to_idx
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def __iter__(self) -> Iterator[Path]:
+        return iter(self.paths)
+
+    def __contains__(self, path: Path) -> bool:
+        return path in self.path_to_idx
+
+    def __getitem__(self, path: Path) -> np.ndarray:
+        return self.hashes[self.path_to_idx[path]]
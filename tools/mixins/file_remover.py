@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from typing import Union, List, Tuple
 
@@ -6,9 +7,13 @@ from logger.logger_protocol import LoggerProtocol
 
 class FileRemoverMixin:
     """A helper class to delete files from the system."""
-    def remove_all(self, filepaths: Union[List[Path], Tuple[Path], Path]) -> None:
+    def remove_all(self: LoggerProtocol, filepaths: Union[List[Path], Tuple[Path], Path]) -> None:
         """Deletes all the files in the given iterable or path.
 
+        Files are unlinked directly, without a stat() check before each one, and a
+        missing file is reported when unlink fails. Each removal is logged at debug
+        level, followed by one summary line at info level.
+
         Args:
             filepaths (Union[List[Path], Tuple[Path], Path]): A list of paths,
                 a tuple of paths, or a single path to delete.
@@ -16,16 +21,22 @@ class FileRemoverMixin:
         Raises:
             TypeError: If the input is not a list, tuple, or Path.
         """
-        if isinstance(filepaths, (list, tuple)):
-            for path in filepaths:
-                self.remove_file(path)
-
-        elif isinstance(filepaths, Path):
-            self.remove_file(filepaths)
-
-        else:
+        if isinstance(filepaths, Path):
+            filepaths = (filepaths,)
+        elif not isinstance(filepaths, (list, tuple)):
             raise TypeError(f'filepaths should be a list or a tuple or a Path, not {type(filepaths)}')
 
+        removed_count = 0
+        for path in filepaths:
+            try:
+                os.unlink(path)
+            except FileNotFoundError:
+                self.logger.warning(f"{path} file not exists, skipping")
+                continue
+            self.logger.debug(f"{path} removed")
+            removed_count += 1
+
+        self.logger.info(f"Removed {removed_count} of {len(filepaths)} files")
 
     def remove_file(self: LoggerProtocol, path: Path) -> bool:
         """Deletes one file from the system.
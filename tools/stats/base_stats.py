@@ -1,6 +1,9 @@
+import os
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from concurrent.futures import ProcessPoolExecutor
 from functools import partial
+from itertools import chain
 from pathlib import Path
 from typing import Optional, Tuple, Dict, Union, List
 
@@ -18,6 +21,7 @@ from tools.annotation_converter.reader.voc import XMLReader
 from tools.annotation_converter.reader.yolo import TXTReader
 from tools.cache import CacheIO
 from services.outlier_detector import OutlierDetector
+from services.process_context import worker_mp_context
 
 
 class BaseStats(ABC):
@@ -28,8 +32,17 @@ class BaseStats(ABC):
     (YOLO, VOC) and provides a high-performance pipeline for feature extraction.
     It supports incremental caching, multi-process execution, and UMAP
     dimensionality reduction for visual manifold analysis.
+
+    Attributes:
+        TASK (str): Task name used in cache file names.
+        CACHE_VERSION (int): Version of the cached feature values, part of the cache file name.
+        UMAP_REFIT_RATIO (float): Share of rows without UMAP coordinates above which
+            the stored scaler and reducer are refitted on the whole dataset instead
+            of only projecting the new rows.
     """
     TASK: str = "stats"
+    CACHE_VERSION: int = 3
+    UMAP_REFIT_RATIO: float = 0.1
 
     def __init__(
             self,
@@ -154,20 +167,23 @@ class BaseStats(ABC):
             source_path=file_paths[0].parent,
             cache_name=self.settings.cache_name,
             format=self.source_suffix,
-            task=self.TASK
+            task=self.TASK,
+            version=self.CACHE_VERSION
         )
 
-        df_cached = self.cache_io.load(cache_file)
+        mtime_map = self._file_mtimes(file_paths)
+        # only the columns needed to find changed files are read first
+        df_cached = self.cache_io.load(cache_file, columns=[ImageStatsKeys.path, ImageStatsKeys.mtime])
+        n_cached = len(df_cached)
 
         if df_cached.empty:
             df_final = pd.DataFrame()
-            files_for_task = file_paths
+            files_for_task = [Path(path) for path in mtime_map]
         else:
-            current_files_state = [
-                {ImageStatsKeys.path: str(path.resolve()), ImageStatsKeys.mtime: path.stat().st_mtime}
-                                   for path in file_paths
-            ]
-            df_disk = pd.DataFrame(current_files_state)
+            df_disk = pd.DataFrame({
+                ImageStatsKeys.path: list(mtime_map.keys()),
+                ImageStatsKeys.mtime: list(mtime_map.values())
+            })
             merged = df_disk.merge(
                 df_cached[[ImageStatsKeys.path, ImageStatsKeys.mtime]].drop_duplicates(),
                 how="left",
@@ -179,7 +195,16 @@ class BaseStats(ABC):
                     (merged[f"{ImageStatsKeys.mtime}_old"].isna()) |
                     (merged[ImageStatsKeys.mtime] != merged[f"{ImageStatsKeys.mtime}_old"]))
             files_for_task = [Path(p) for p in merged.loc[to_update_mask, ImageStatsKeys.path]]
-            df_final = df_cached[df_cached[ImageStatsKeys.path].isin(df_disk[~to_update_mask][ImageStatsKeys.path])]
+            kept_paths = df_disk.loc[~to_update_mask, ImageStatsKeys.path]
+
+            # full rows are read only for unchanged files, the filter is applied while reading
+            if kept_paths.empty:
+                df_final = pd.DataFrame()
+            else:
+                df_kept = self.cache_io.load(
+                    cache_file, filters=[(ImageStatsKeys.path, "in", kept_paths.tolist())]
+                )
+                df_final = df_kept[df_kept[ImageStatsKeys.path].isin(kept_paths)]
 
         if files_for_task:
             self.logger.info(f"Incremental update: processing {len(files_for_task)} files with {self.n_jobs} workers")
@@ -192,21 +217,23 @@ class BaseStats(ABC):
                 margin_threshold=self.margin_threshold,
                 class_mapping=class_mapping)
 
+            mp_context = worker_mp_context()
+
             with ProcessPoolExecutor(
                     max_workers=self.n_jobs,
+                    mp_context=mp_context,
                     initializer=self.__class__._init_worker,
                     initargs=(images,)
             ) as executor:
-                results = list(executor.map(worker_func, files_for_task))
-
-            new_data = [item for sublist in results for item in sublist]
+                chunksize = max(1, len(files_for_task) // (self.n_jobs * 4))
+                # per-file row lists are flattened while results arrive, without a list of lists in between
+                new_data = list(chain.from_iterable(executor.map(worker_func, files_for_task, chunksize=chunksize)))
 
             if new_data:
                 df_new = pd.DataFrame(new_data)
-                mtime_map = {str(path): path.stat().st_mtime for path in files_for_task}
                 df_new[ImageStatsKeys.mtime] = df_new[ImageStatsKeys.path].map(mtime_map)
+                # a single concat builds the result, ignore_index already gives a fresh RangeIndex
                 df_final = pd.concat([df_final, df_new], ignore_index=True)
-                df_final.reset_index(drop=True, inplace=True)
 
                 numeric_cols = []
                 for section in self.settings.img_dataset_report_schema:
@@ -217,24 +244,74 @@ class BaseStats(ABC):
                 df_final = OutlierDetector.mark_outliers(df_final, numeric_cols)
                 self.logger.info(f"computing UMAP coordinates for the entire dataset with {self.n_jobs} workers")
                 features = self.get_umap_features(df_final)
-                df_final = self.compute_umap_coords(df=df_final, features=features)
-            if files_for_task or (len(df_cached) != len(df_final)):
-                self.cache_io.save(df_final, cache_file)
-                self.logger.info(f"Cache updated at {cache_file} with {len(df_final)} records")
+                df_final = self.compute_umap_coords(
+                    df=df_final,
+                    features=features,
+                    model_file=cache_file.with_suffix(CacheIO.MODEL_SUFFIX)
+                )
+        if files_for_task or (n_cached != len(df_final)):
+            self.cache_io.save_dataframe(df_final, cache_file)
+            self.logger.info(f"Cache updated at {cache_file} with {len(df_final)} records")
 
         return df_final
 
 
-    def compute_umap_coords(self, df: pd.DataFrame, features: List[str]) -> pd.DataFrame:
+    @staticmethod
+    def _file_mtimes(file_paths: Tuple[Path, ...]) -> Dict[str, float]:
+        """
+        Collects modification times of the files, scanning each directory once.
+
+        Every directory is resolved once and read with os.scandir, so files need
+        neither a resolve() nor a separate stat() path lookup each. Only symlinked
+        files are resolved, so they stay keyed by their target path.
+
+        Args:
+            file_paths (Tuple[Path, ...]): Files to look up.
+
+        Returns:
+            Dict[str, float]: Mapping of resolved file paths to their mtime, in the
+                order of file_paths, for the files that exist.
+        """
+        names_by_dir = defaultdict(set)
+        for path in file_paths:
+            names_by_dir[path.parent].add(path.name)
+
+        bases = {}
+        scanned = {}
+        for directory, names in names_by_dir.items():
+            bases[directory] = base = str(directory.resolve())
+            with os.scandir(base) as entries:
+                for entry in entries:
+                    if entry.name in names:
+                        path = os.path.realpath(entry.path) if entry.is_symlink() else entry.path
+                        scanned[entry.path] = (path, entry.stat().st_mtime)
+
+        resolved_paths = (os.path.join(bases[path.parent], path.name) for path in file_paths)
+        return dict(scanned[path] for path in resolved_paths if path in scanned)
+
+    def compute_umap_coords(
+            self,
+            df: pd.DataFrame,
+            features: List[str],
+            model_file: Optional[Path] = None
+    ) -> pd.DataFrame:
         """
         Performs dimensionality reduction to visualize the dataset manifold.
 
         Uses StandardScaler for normalization and UMAP to project high-dimensional
         features into a 2D space. Results are saved as 'umap_x' and 'umap_y' columns.
 
+        If model_file holds a scaler and reducer fitted on the same feature columns
+        and only a small share of rows (below UMAP_REFIT_RATIO) has no coordinates
+        yet, those rows are projected onto the stored manifold with transform and
+        the other rows keep their coordinates. Otherwise the whole dataset is
+        fitted again and the fitted models are stored in model_file.
+
         Args:
             df (pd.DataFrame): The feature matrix.
             features (List[str]): Columns to be used for reduction.
+            model_file (Optional[Path]): File to reuse and store the fitted scaler and
+                reducer. Without it the models are always fitted from scratch.
 
         Returns:
             pd.DataFrame: DataFrame with added UMAP coordinates.
@@ -246,7 +323,20 @@ class BaseStats(ABC):
         if x_data.shape[1] < 2:
             return df
 
-        x_scaled = StandardScaler().fit_transform(x_data)
+        columns = list(x_data.columns)
+        coords = ["umap_x", "umap_y"]
+        new_rows = df[coords].isna().any(axis=1) if set(coords).issubset(df.columns) else None
+        model = self.cache_io.load_model(model_file) if model_file and new_rows is not None else None
+
+        if model is not None and model["columns"] == columns and new_rows.mean() < self.UMAP_REFIT_RATIO:
+            if new_rows.any():
+                self.logger.info(f"Projecting {int(new_rows.sum())} new rows onto the stored UMAP manifold")
+                embedding = model["reducer"].transform(model["scaler"].transform(x_data[new_rows]))
+                df.loc[new_rows, coords] = embedding
+            return df
+
+        scaler = StandardScaler()
+        x_scaled = scaler.fit_transform(x_data)
         n_neighbors = int(np.clip(len(x_data) * 0.1, a_min=15, a_max=50))
         reducer = UMAP(n_neighbors=n_neighbors, min_dist=0.1, n_components=2, n_jobs=self.n_jobs)
         embedding = reducer.fit_transform(x_scaled)
@@ -254,6 +344,9 @@ class BaseStats(ABC):
         df['umap_x'] = embedding[:, 0]
         df['umap_y'] = embedding[:, 1]
 
+        if model_file:
+            self.cache_io.save_model({"columns": columns, "scaler": scaler, "reducer": reducer}, model_file)
+
         return df
 
     def set_class_mapping(self, file_paths: Tuple[Path]) -> Dict[str, str]:
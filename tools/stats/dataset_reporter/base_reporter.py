@@ -2,7 +2,6 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Union, List
 
-import numpy as np
 import pandas as pd
 from matplotlib.backends.backend_pdf import PdfPages
 
@@ -93,14 +92,17 @@ class BaseDatasetReporter(ABC):
 
         if section["type"] == "numeric":
             stats = df[cols].describe().T
+            # sweet spot limits of all columns at once, by the IQR rule
+            iqr = stats["75%"] - stats["25%"]
+            stats["min_limit"] = (stats["25%"] - 1.5 * iqr).clip(lower=0)
+            stats["max_limit"] = stats["75%"] + 1.5 * iqr
+            # plain dict rows, so the loop below does no pandas label lookups
+            stats = stats.to_dict("index")
+            outlier_cols = [f"outlier_{col}" for col in cols if f"outlier_{col}" in df.columns]
+            outlier_sums = df[outlier_cols].sum()
             for col in cols:
-                row = stats.loc[col]
-                outlier_col = f"outlier_{col}"
-                outliers_count = df[outlier_col].sum()
-
-                iqr = row["75%"] - row["25%"]
-                min_limit = np.clip(row["25%"] - 1.5 * iqr, a_min=0, a_max=None)
-                max_limit = row["75%"] + 1.5 * iqr
+                row = stats[col]
+                outliers_count = outlier_sums.get(f"outlier_{col}", 0)
 
                 lines.append(
                     f"  - {col:<25}:"
@@ -108,7 +110,7 @@ class BaseDatasetReporter(ABC):
                     f" avg {row['mean']:>10.2f}, std {row['std']:<10.2f} |"
                     f" min {row['min']:>10.2f}, max {row['max']:>10.2f}  |"
                     f" outliers: {int(outliers_count):<4} |"
-                    f"{min_limit:10.2f} < sweet spot < {max_limit:10.2f} "
+                    f"{row['min_limit']:10.2f} < sweet spot < {row['max_limit']:10.2f} "
                 )
         elif section["type"] == "binary":
             sums = df[cols].sum()
@@ -1,6 +1,7 @@
 from pathlib import Path
-from typing import Union, List
+from typing import Union, List, Tuple
 
+import numpy as np
 import pandas as pd
 from matplotlib.backends.backend_pdf import PdfPages
 
@@ -16,7 +17,18 @@ class ImageDatasetReporter(BaseDatasetReporter):
     This class orchestrates the complete reporting pipeline. It aggregates
     geometric and pixel-level features to generate structured console logs,
     spatial heatmaps, correlation matrices, and UMAP manifold projections.
+
+    Attributes:
+        SPATIAL_GRID_COLUMNS (Tuple[str, ...]): Object position columns in row-major
+            order of the 3x3 spatial heatmap.
     """
+    SPATIAL_GRID_COLUMNS: Tuple[str, ...] = (
+        ImageStatsKeys.object_in_left_top, ImageStatsKeys.object_in_top_side, ImageStatsKeys.object_in_right_top,
+        ImageStatsKeys.object_in_left_side, ImageStatsKeys.object_in_center, ImageStatsKeys.object_in_right_side,
+        ImageStatsKeys.object_in_left_bottom, ImageStatsKeys.object_in_bottom_side,
+        ImageStatsKeys.object_in_right_bottom,
+    )
+
     def generate_visual_report(
             self,
             df: pd.DataFrame,
@@ -49,12 +61,27 @@ class ImageDatasetReporter(BaseDatasetReporter):
         StatsPlotter.plot_geometry_analysis(df, destination)
 
         # correlation bias between classes and features
-        class_dummies = pd.get_dummies(df[class_col], prefix='class').astype(int)
-        df_combined = pd.concat([df[features], class_dummies], axis=1)
-        full_corr = df_combined.corr()
-
-        class_cols = [c for c in full_corr.columns if c.startswith('class_')]
-        bias_matrix = full_corr.loc[class_cols, features]
+        # one-hot rows are gathered from category codes; the extra zero row of the
+        # identity matrix is picked by code -1, so missing class names stay all-zero
+        classes = df[class_col].astype("category")
+        n_classes = len(classes.cat.categories)
+        one_hot = np.eye(n_classes + 1, n_classes, dtype=np.uint8)[classes.cat.codes.to_numpy()]
+        class_dummies = pd.DataFrame(
+            one_hot, columns=[f"class_{name}" for name in classes.cat.categories], index=df.index
+        )
+        feature_values = df[features].to_numpy(dtype=np.float64)
+
+        if np.isfinite(feature_values).all():
+            # only the classes x features block is computed, with one matrix product
+            bias_matrix = pd.DataFrame(
+                self._cross_correlation(one_hot.astype(np.float64), feature_values),
+                index=class_dummies.columns,
+                columns=features
+            )
+        else:
+            # missing values need pandas' pairwise-complete correlation
+            full_corr = pd.concat([df[features], class_dummies], axis=1).corr()
+            bias_matrix = full_corr.loc[class_dummies.columns, features]
 
         StatsPlotter.plot_correlation_matrix(
             bias_matrix, "Dataset Bias: Classes vs Features",
@@ -63,19 +90,12 @@ class ImageDatasetReporter(BaseDatasetReporter):
 
         # heatpaps for spatial distribution of objects
         all_class_corrs = df.groupby(class_col)[features].corr()
+        # all 3x3 grids come from one grouped sum, columns are in row-major grid order
+        spatial_sums = df.groupby(class_col)[list(self.SPATIAL_GRID_COLUMNS)].sum()
 
-        for name in sorted(df[class_col].unique()):
-            class_df = df[df[ImageStatsKeys.class_name] == name]
-
+        for name, spatial_row in spatial_sums.iterrows():
             # Теплокарта 3х3
-            grid = [
-                [class_df['object_in_left_top'].sum(), class_df['object_in_top_side'].sum(),
-                 class_df['object_in_right_top'].sum()],
-                [class_df['object_in_left_side'].sum(), class_df['object_in_center'].sum(),
-                 class_df['object_in_right_side'].sum()],
-                [class_df['object_in_left_bottom'].sum(), class_df['object_in_bottom_side'].sum(),
-                 class_df['object_in_right_bottom'].sum()]
-            ]
+            grid = spatial_row.to_numpy().reshape(3, 3).tolist()
             StatsPlotter.plot_spatial_heatmap(grid, f"Spatial Density: {name.upper()}", destination, f"heat_{name}.png")
 
             # Внутрішня кореляція фіч
@@ -87,6 +107,29 @@ class ImageDatasetReporter(BaseDatasetReporter):
         # UMAP manifold projection
         StatsPlotter.plot_dataset_manifold(df=df, class_col=class_col, destination=destination)
 
+    @staticmethod
+    def _cross_correlation(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Calculates the Pearson correlation of every column of x with every column of y.
+
+        Both matrices are centered, and the correlations come from one matrix
+        product divided by the outer product of the column norms. Columns without
+        variance give NaN, as in pandas.
+
+        Args:
+            x (np.ndarray): A 2D (N, A) float array without missing values.
+            y (np.ndarray): A 2D (N, B) float array without missing values.
+
+        Returns:
+            np.ndarray: A 2D (A, B) array of correlation coefficients.
+        """
+        x = x - x.mean(axis=0)
+        y = y - y.mean(axis=0)
+        norms = np.outer(np.sqrt((x * x).sum(axis=0)), np.sqrt((y * y).sum(axis=0)))
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.clip((x.T @ y) / norms, -1.0, 1.0)
+
     def show_console_report(self, df: pd.DataFrame, target_format: str) -> None:
         """
         Aggregates dataset statistics and prints a structured technical summary.
@@ -99,8 +142,9 @@ class ImageDatasetReporter(BaseDatasetReporter):
             target_format (str): The annotation format (e.g., 'yolo', 'voc').
         """
         total_objects = len(df)
-        total_annotations = df[ImageStatsKeys.im_path].nunique()
         objects_per_image = df.groupby(ImageStatsKeys.im_path).size()
+        # one group per distinct image path, the same count nunique() would hash again
+        total_annotations = len(objects_per_image)
         average_density = objects_per_image.mean()
         std_density = objects_per_image.std()
 
@@ -118,8 +162,8 @@ class ImageDatasetReporter(BaseDatasetReporter):
             if "IMAGE QUALITY" in section["title"]:
                 report_rows.extend(self._render_section(df, section, total_objects))
 
-        for object_name in sorted(df['class_name'].unique()):
-            cls_df = df[df['class_name'] == object_name]
+        # one groupby pass splits the rows by class instead of masking the whole frame per class
+        for object_name, cls_df in df.groupby(ImageStatsKeys.class_name, sort=True):
             cls_count = len(cls_df)
 
             report_rows.append(f"\n >>> CLASS: {object_name} ({(cls_count / total_objects) * 100:.1f}%)")
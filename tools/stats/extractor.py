@@ -42,7 +42,7 @@ class FeatureExtractor:
             im_width = int(image_data.get(XMLNames.width, 0))
             im_height = int(image_data.get(XMLNames.height, 0))
 
-            if any([im_width <= 0, im_height <= 0]):
+            if im_width <= 0 or im_height <= 0:
                 return []
 
             im_depth = int(image_data.get(XMLNames.depth, 0))
@@ -141,16 +141,12 @@ class FeatureExtractor:
                 in_bottom_side = 1 if (row_idx == 2 and col_idx == 1) else 0
                 in_right_bottom = 1 if (row_idx == 2 and col_idx == 2) else 0
 
-                truncated_left = 1 if xmin < margin_threshold else 0
-                truncated_right = 1 if xmax > (im_width - margin_threshold) else 0
-                truncated_top = 1 if ymin < margin_threshold else 0
-                truncated_bottom = 1 if ymax > (im_height - margin_threshold) else 0
+                truncated_left = int(xmin < margin_threshold)
+                truncated_right = int(xmax > (im_width - margin_threshold))
+                truncated_top = int(ymin < margin_threshold)
+                truncated_bottom = int(ymax > (im_height - margin_threshold))
 
-                full_size = 1 if all([
-                    truncated_left,
-                    truncated_right,
-                    truncated_top,
-                    truncated_bottom]) else 0
+                full_size = truncated_left & truncated_right & truncated_top & truncated_bottom
 
                 object_data = {
                     ImageStatsKeys.path: filepath,
@@ -2,7 +2,6 @@ from pathlib import Path
 from typing import Dict
 
 import cv2
-import numpy as np
 
 from const_utils.stats_constansts import ImageStatsKeys
 
@@ -14,7 +13,12 @@ class ImageContentAnalyzer:
     This class extracts physical metrics from images, such as brightness,
     contrast, and sharpness (blur score), which are essential for
     understanding the quality of a computer vision dataset.
+
+    Attributes:
+        GRAYSCALE_READ_SUFFIXES (tuple): Lowercase suffixes of the formats whose
+            grayscale decode gives the same luminance as BGR decoding plus cvtColor.
     """
+    GRAYSCALE_READ_SUFFIXES = (".jpg", ".jpeg")
 
     @staticmethod
     def analyze_metrics(img_path: str) -> Dict[str, float]:
@@ -22,10 +26,13 @@ class ImageContentAnalyzer:
         Calculates brightness, contrast, and blur score for an image file.
 
         The method performs the following steps:
-        1. Reads the image from the disk in BGR format.
-        2. Converts the image to grayscale.
-        3. Computes the mean (brightness), standard deviation (contrast),
-           and Laplacian variance (blur score).
+        1. Reads the image from the disk in grayscale. JPEGs are decoded straight
+           in grayscale, so libjpeg skips the color channels and no conversion pass
+           is needed. Other formats are decoded in BGR and converted with cvtColor,
+           since e.g. libpng's own gray conversion shifts the brightness.
+        2. Computes the mean (brightness) and standard deviation (contrast) in
+           one pass with cv2.meanStdDev, and the Laplacian variance (blur score)
+           from the standard deviation of a float32 Laplacian.
 
         Args:
             img_path (Path): The file system path to the image.
@@ -35,18 +42,24 @@ class ImageContentAnalyzer:
                 Returns an empty dictionary if the image cannot be read.
         """
         try:
-            image = cv2.imread(str(img_path))
+            if Path(img_path).suffix.lower() in ImageContentAnalyzer.GRAYSCALE_READ_SUFFIXES:
+                image_gray = cv2.imread(str(img_path), cv2.IMREAD_GRAYSCALE)
+            else:
+                image = cv2.imread(str(img_path))
+                image_gray = None if image is None else cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         except Exception:
             return {}
 
-        if image is None:
+        if image_gray is None:
             return {}
 
-        image_gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        # mean and std come from one pass; the Laplacian of uint8 pixels is exact in float32
+        mean, std = cv2.meanStdDev(image_gray)
+        _, laplacian_std = cv2.meanStdDev(cv2.Laplacian(image_gray, cv2.CV_32F))
 
         data = {
-            ImageStatsKeys.im_brightness: round(float(np.mean(image_gray)), 2),
-            ImageStatsKeys.im_contrast: round(float(np.std(image_gray)), 2),
-            ImageStatsKeys.im_blur_score: round(float(cv2.Laplacian(image_gray, cv2.CV_64F).var()), 2)
+            ImageStatsKeys.im_brightness: round(float(mean[0, 0]), 2),
+            ImageStatsKeys.im_contrast: round(float(std[0, 0]), 2),
+            ImageStatsKeys.im_blur_score: round(float(laplacian_std[0, 0]) ** 2, 2)
         }
         return data
\ No newline at end of file
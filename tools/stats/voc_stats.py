@@ -1,6 +1,7 @@
 from pathlib import Path
 from typing import Optional, Dict, List
 
+import cv2
 import numpy as np
 import pandas as pd
 
@@ -57,10 +58,13 @@ class VOCStats(BaseStats):
 
         This method is called once per worker process during the startup
         of the ProcessPoolExecutor to provide fast access to image paths.
+        OpenCV is limited to one thread, since the pool already runs one
+        worker per core.
 
         Args:
             image_dict (Dict[str, str]): Map of image stems to their absolute paths.
         """
+        cv2.setNumThreads(1)
         cls._worker_image_map = image_dict
 
     @staticmethod
@@ -1,6 +1,7 @@
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import cv2
 import numpy as np
 import pandas as pd
 
@@ -31,11 +32,13 @@ class YoloStats(BaseStats):
         Initializes a worker process with a shared image map.
 
         This method ensures each parallel worker has access to the full
-        list of image paths during the analysis.
+        list of image paths during the analysis. OpenCV is limited to one
+        thread, since the pool already runs one worker per core.
 
         Args:
             image_dict (Dict[str, str]): Map of image stems to their absolute paths.
         """
+        cv2.setNumThreads(1)
         cls._worker_image_map = image_dict
 
 
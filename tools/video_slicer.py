@@ -1,3 +1,5 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import cv2
 
@@ -5,7 +7,13 @@ class VideoSlicer:
     """A class to cut a video into many images.
 
     This class takes a video file and saves its frames as separate image files in a folder.
+
+    Attributes:
+        MAX_WRITERS (int): Number of threads encoding and writing frames while the
+            next frames are decoded.
     """
+    MAX_WRITERS: int = 4
+
     def __init__(self):
         """Initializes the VideoSlicer.
 
@@ -17,6 +25,11 @@ class VideoSlicer:
     def slice(self, source_file: Path, target_dir: Path, suffix: str = ".jpg", step: float = 1) -> tuple:
         """Cuts the video into images and saves them to a folder.
 
+        Only every step-th frame is retrieved as an image; the frames in between
+        are grabbed to advance the stream, which skips their color conversion and copy.
+        Saved frames are encoded and written by a small thread pool; all images are
+        on disk when the method returns.
+
         Args:
             source_file (Path): The path to the video file you want to cut.
             target_dir (Path): The folder where you want to save the images.
@@ -38,19 +51,35 @@ class VideoSlicer:
         img_counter = 0
         frame_id = 0
 
-        while True:
-            ret, frame = cap.read()
+        # cv2.imwrite releases the GIL, so frames are encoded and written in threads while
+        # the next ones are decoded; at most 2 * MAX_WRITERS frames wait in memory
+        with ThreadPoolExecutor(max_workers=self.MAX_WRITERS) as writer:
+            pending = deque()
+
+            while True:
+                if frame_id % step_frames == 0:
+                    # read() returns a newly allocated array, so the frame can be handed to a writer
+                    ret, frame = cap.read()
+
+                    if not ret:
+                        break
+
+                    new_filename = f"{source_file.stem}_{img_counter}{suffix}"
+                    file_path = target_dir / new_filename
+                    pending.append(writer.submit(cv2.imwrite, str(file_path), frame))
+                    img_counter += 1
+
+                    if len(pending) > 2 * self.MAX_WRITERS:
+                        pending.popleft().result()
 
-            if not ret:
-                break
+                # skipped frames are only grabbed, without conversion to a BGR image
+                elif not cap.grab():
+                    break
 
-            if frame_id % step_frames == 0:
-                new_filename = f"{source_file.stem}_{img_counter}{suffix}"
-                file_path = target_dir / new_filename
-                cv2.imwrite(str(file_path), frame)
-                img_counter += 1
+                frame_id += 1
 
-            frame_id += 1
+            for future in pending:
+                future.result()
 
         cap.release()
         self.__sliced = True